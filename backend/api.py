@@ -1,11 +1,25 @@
-from fastapi import FastAPI, HTTPException, Depends, Header
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Header, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, PlainValidator, ValidationError
+from typing import Annotated, Optional
+from datetime import datetime
 from resumer import Resumer
 from models import Resume
-import tempfile
+from renderer import FormatCache, PdfRenderer, RenderQueueFull, RenderTimeout
+from render_cache import RenderCache, render_key
+from latex_template import CompiledTemplate, TemplateRegistry
+from fast_json import FastJSONResponse, FastJSONRoute, ndjson_line
+from tailor_cache import TailorCache
+from page_fit import page_metrics
+from resume_store import create_resume_store
+from json_patch import PatchError, PatchTestFailed, apply_patch, json_equal
+import base64
+import uuid
+import hashlib
+import orjson
 import os
 from dotenv import load_dotenv
 
@@ -13,14 +27,34 @@ load_dotenv()
 
 # Optional Supabase import - gracefully degrade if not configured
 try:
-    from supabase_client import get_supabase, verify_jwt
-    SUPABASE_ENABLED = True
+    from supabase_client import auth_configured, close_http_client, verify_jwt
+    SUPABASE_ENABLED = auth_configured()
 except ImportError:
     SUPABASE_ENABLED = False
-    get_supabase = None
+    close_http_client = None
     verify_jwt = None
 
-app = FastAPI(title="Resumer API", description="Resume tailoring API")
+# Initialize resumer once; the embedding model loads in the background
+resumer = Resumer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Set PRELOAD_MODEL=false to defer loading until the first /tailor call
+    if os.getenv("PRELOAD_MODEL", "true").lower() != "false":
+        resumer.start_loading()
+    if pdf_renderer.formats is not None:
+        # Build each template's preamble format in the background, ahead of the first export
+        for name in templates.names():
+            pdf_renderer.formats.prepare(templates.get(name).source)
+    yield
+    if close_http_client is not None:
+        await close_http_client()
+
+
+app = FastAPI(title="Resumer API", description="Resume tailoring API", lifespan=lifespan)
+# Parse request bodies with orjson; must be set before any route is declared
+app.router.route_class = FastJSONRoute
 
 # CORS configuration - use ALLOWED_ORIGINS env var in production (comma-separated)
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
@@ -30,38 +64,96 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Tailor-Version", "X-Render-Cache", "ETag"],
 )
 
-# Initialize resumer once (loads embedding model)
-resumer = Resumer()
+# PDF exports run in their own bounded subprocess pool so they can't starve /tailor
+latex_format_dir = os.getenv("LATEX_FORMAT_DIR", "../data/cache/formats")
+pdf_renderer = PdfRenderer(
+    workers=int(os.getenv("PDF_WORKERS", "0")) or None,
+    queue_size=int(os.getenv("PDF_QUEUE_SIZE")) if os.getenv("PDF_QUEUE_SIZE") else None,
+    timeout=float(os.getenv("PDF_TIMEOUT_SECONDS", "30")),
+    formats=FormatCache(latex_format_dir) if latex_format_dir else None,
+)
+
+# Templates are parsed once and reloaded only when their file changes
+templates = TemplateRegistry(
+    os.getenv("TEMPLATE_DIR", "../data/templates"),
+    rescan_interval=float(os.getenv("TEMPLATE_RESCAN_SECONDS", "2")),
+)
+
+# Repeated exports of an unchanged resume are served from disk
+render_cache = RenderCache(
+    os.getenv("RENDER_CACHE_DIR", "../data/cache/renders"),
+    max_bytes=int(os.getenv("RENDER_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+
+
+# Recent /tailor results, so follow-up edits only rescore what changed
+tailor_cache = TailorCache(int(os.getenv("TAILOR_CACHE_MAX_ENTRIES", "256")))
 
 
 # --- Request Models ---
+# Resume payloads are only checked to be JSON objects: full validation would copy
+# every nested dict before Resume(...) walks it again.
+
+def _require_object(value):
+    if not isinstance(value, dict):
+        raise ValueError("must be a JSON object")
+    return value
+
+
+def _require_objects(value):
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        raise ValueError("must be a list of JSON objects")
+    return value
+
+
+JSONObject = Annotated[dict, PlainValidator(_require_object, json_schema_input_type=dict)]
+JSONObjectList = Annotated[list[dict], PlainValidator(_require_objects, json_schema_input_type=list[dict])]
 
 class TailorRequest(BaseModel):
-    resume: dict
+    resume: JSONObject
     job_description: str
     exp_bullet_count: int = 7
     proj_bullet_count: int = 5
     tech_count: int = 5
     lang_count: int = 5
+    omit_null_metrics: bool = False  # drop similarity/impressiveness/score keys that are null
+    base_version: Optional[str] = None  # X-Tailor-Version of an earlier /tailor response
+    fit: bool = False  # trim to one page of `template`; bullet counts become upper bounds
+    template: str = "jake"
+
+
+class TailorBatchRequest(BaseModel):
+    resumes: JSONObjectList
+    job_descriptions: list[str]
+    exp_bullet_count: int = 7
+    proj_bullet_count: int = 5
+    tech_count: int = 5
+    lang_count: int = 5
+    omit_null_metrics: bool = False
 
 
 class ExportRequest(BaseModel):
-    resume: dict
-    template: str = "jake"  # "jake" or "mirage"
+    resume: JSONObject
+    template: str = "jake"  # any name listed by GET /templates
 
 
 class SaveResumeRequest(BaseModel):
     name: str = "Untitled Resume"
-    full_resume: dict
-    tailored_resume: Optional[dict] = None
+    full_resume: JSONObject
+    tailored_resume: Optional[JSONObject] = None
 
 
 class UpdateResumeRequest(BaseModel):
     name: Optional[str] = None
-    full_resume: Optional[dict] = None
-    tailored_resume: Optional[dict] = None
+    full_resume: Optional[JSONObject] = None
+    tailored_resume: Optional[JSONObject] = None
+
+
+# Top-level fields of a saved resume that PUT and PATCH may change
+EDITABLE_FIELDS = ("name", "full_resume", "tailored_resume")
 
 
 # --- Auth Dependency ---
@@ -69,16 +161,30 @@ class UpdateResumeRequest(BaseModel):
 async def get_current_user(authorization: str = Header(None)) -> dict:
     """Extract and verify user from Authorization header."""
     if not SUPABASE_ENABLED:
-        raise HTTPException(status_code=503, detail="Supabase not configured. Install supabase package and set credentials.")
+        raise HTTPException(status_code=503, detail="Supabase not configured. Set SUPABASE_URL (or SUPABASE_JWT_SECRET) and credentials.")
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
     token = authorization.replace("Bearer ", "")
-    user = verify_jwt(token)
+    user = await verify_jwt(token)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     return user
 
 
+_resume_store = None
+
+
+def get_resume_store():
+    """The configured resume store (RESUME_STORE), created on first use."""
+    global _resume_store
+    if _resume_store is None:
+        try:
+            _resume_store = create_resume_store()
+        except (RuntimeError, ValueError) as e:
+            raise HTTPException(status_code=503, detail=str(e))
+    return _resume_store
+
+
 # --- Endpoints ---
 
 @app.get("/health")
@@ -87,54 +193,115 @@ def health_check():
     return {"status": "healthy", "service": "resumer-api"}
 
 
+@app.get("/ready")
+def readiness_check():
+    """Readiness probe: 200 once the embedding model is loaded, 503 until then."""
+    if resumer.model_ready:
+        return {"status": "ready"}
+    if resumer.load_error is not None:
+        raise HTTPException(status_code=503, detail=f"Embedding model failed to load: {resumer.load_error}")
+    raise HTTPException(status_code=503, detail="Embedding model is warming up", headers={"Retry-After": "5"})
+
+
+@app.get("/stats")
+def cache_stats():
+    """Cache sizes and hit ratios."""
+    return {
+        "embeddings": resumer.relevance_engine.cache_stats() if resumer.model_ready else None,
+        "renders": render_cache.stats(),
+    }
+
+
 @app.post("/tailor")
 def tailor_resume(request: TailorRequest):
     """
     Tailor resume to job description.
-    Returns the tailored resume as JSON.
+    Returns the tailored resume as JSON, with its version in X-Tailor-Version.
+    Pass that version back as base_version to re-tailor an edited resume: only
+    new or changed bullets are rescored, and a count-only change skips the model.
     """
+    base = tailor_cache.get(request.base_version)
+    if base is None or not base.matches(request.resume, request.job_description):
+        _require_model()
+    fit = _fit_metrics(request)
     try:
-        resume = Resume(request.resume)
-        tailored = resumer.tailor_resume(
-            resume,
+        tailored, state = resumer.retailor(
+            request.resume,
             request.job_description,
             request.exp_bullet_count,
             request.proj_bullet_count,
             request.tech_count,
+            request.lang_count,
+            base=base,
+            fit=fit
+        )
+        version = request.base_version if state is base else tailor_cache.put(state)
+        return FastJSONResponse(tailored.to_dict(request.omit_null_metrics), headers={"X-Tailor-Version": version})
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=_error_detail(e))
+
+
+@app.post("/tailor/stream")
+def tailor_resume_stream(request: TailorRequest):
+    """
+    Tailor resume to job description, streaming NDJSON records as results are
+    ready: {"event": "skills"} with the trimmed technologies/languages, one
+    {"event": "section"} per experience/project (by input index), then
+    {"event": "resume"} with the final resume and its version. Failures after
+    the stream has started arrive as {"event": "error"}.
+    """
+    base = tailor_cache.get(request.base_version)
+    if base is None or not base.matches(request.resume, request.job_description):
+        _require_model()
+    return StreamingResponse(_tailor_events(request, base, _fit_metrics(request)), media_type="application/x-ndjson")
+
+
+@app.post("/tailor/batch")
+def tailor_resume_batch(request: TailorBatchRequest):
+    """
+    Tailor many resumes to many job descriptions in one call.
+    Returns results[i][j]: resume i tailored to job description j.
+    """
+    _require_model()
+    try:
+        resumes = [Resume(item) for item in request.resumes]
+        tailored = resumer.tailor_many(
+            resumes,
+            request.job_descriptions,
+            request.exp_bullet_count,
+            request.proj_bullet_count,
+            request.tech_count,
             request.lang_count
         )
-        return tailored.to_dict()
+        return FastJSONResponse({"results": [[resume.to_dict(request.omit_null_metrics) for resume in row] for row in tailored]})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/export/pdf")
-def export_pdf(request: ExportRequest):
+async def export_pdf(request: ExportRequest):
     """
     Export resume to PDF.
     Returns PDF bytes.
     """
     try:
-        resume = Resume(request.resume)
-        template_path = _get_template_path(request.template)
-        
-        # Generate PDF to temp file and return bytes
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = tmp.name
-        
-        try:
-            resumer.export_to_pdf(resume, template_path=template_path, output_path=tmp_path)
-            with open(tmp_path, "rb") as f:
-                pdf_bytes = f.read()
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={"Content-Disposition": "attachment; filename=resume.pdf"}
-            )
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-                
+        # Template lookup, cache reads and LaTeX rendering are blocking; keep them off the event loop
+        key, pdf_bytes, latex_content = await run_in_threadpool(_prepare_pdf, request)
+        cache_status = "hit" if pdf_bytes is not None else "miss"
+        if pdf_bytes is None:
+            pdf_bytes = await pdf_renderer.render(latex_content)
+            await run_in_threadpool(render_cache.put, key, pdf_bytes)
+        return Response(
+            content=pdf_bytes,
+            media_type="application/pdf",
+            headers={"Content-Disposition": "attachment; filename=resume.pdf", "X-Render-Cache": cache_status}
+        )
+    except RenderQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except RenderTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -147,12 +314,17 @@ def export_latex(request: ExportRequest):
     """
     try:
         resume = Resume(request.resume)
-        template_path = _get_template_path(request.template)
-        latex_content = resumer.resume_to_latex_from_template(resume, template_path)
+        template = _get_template(request.template)
+        key = render_key(template.source, resume.to_dict(), "latex")
+        latex_bytes = render_cache.get(key)
+        cache_status = "hit" if latex_bytes is not None else "miss"
+        if latex_bytes is None:
+            latex_bytes = resumer.resume_to_latex(resume, template).encode("utf-8")
+            render_cache.put(key, latex_bytes)
         return Response(
-            content=latex_content,
+            content=latex_bytes,
             media_type="text/plain",
-            headers={"Content-Disposition": "attachment; filename=resume.tex"}
+            headers={"Content-Disposition": "attachment; filename=resume.tex", "X-Render-Cache": cache_status}
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -161,47 +333,73 @@ def export_latex(request: ExportRequest):
 @app.get("/templates")
 def list_templates():
     """List available templates."""
-    return {"templates": ["jake", "mirage"]}
+    return {"templates": templates.names()}
 
 
 # --- Resume CRUD Endpoints (Auth Required) ---
 
 @app.get("/resumes")
-async def list_resumes(user: dict = Depends(get_current_user)):
-    """List all resumes for the authenticated user."""
+async def list_resumes(
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+    store=Depends(get_resume_store)
+):
+    """
+    List resumes for the authenticated user, most recently updated first.
+    With `limit`, returns one page and a `next_cursor` to pass back as `cursor`
+    for the next (null on the last page).
+    """
+    after = _decode_cursor(cursor) if cursor else None
     try:
-        supabase = get_supabase()
-        result = supabase.table("resumes").select("id, name, created_at, updated_at").eq("user_id", user["id"]).order("updated_at", desc=True).execute()
-        return {"resumes": result.data}
+        rows = await store.list_resumes(user["id"], limit=limit + 1 if limit else None, after=after)
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1])
+        return FastJSONResponse({"resumes": rows, "next_cursor": next_cursor})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/resumes")
-async def save_resume(request: SaveResumeRequest, user: dict = Depends(get_current_user)):
+async def save_resume(request: SaveResumeRequest, user: dict = Depends(get_current_user), store=Depends(get_resume_store)):
     """Save a new resume."""
     try:
-        supabase = get_supabase()
-        result = supabase.table("resumes").insert({
-            "user_id": user["id"],
+        resume = await store.create_resume(user["id"], {
             "name": request.name,
             "full_resume": request.full_resume,
             "tailored_resume": request.tailored_resume
-        }).execute()
-        return {"resume": result.data[0] if result.data else None}
+        })
+        return FastJSONResponse({"resume": resume})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/resumes/{resume_id}")
-async def get_resume(resume_id: str, user: dict = Depends(get_current_user)):
-    """Get a specific resume by ID."""
+async def get_resume(
+    resume_id: str,
+    if_none_match: Optional[str] = Header(None),
+    user: dict = Depends(get_current_user),
+    store=Depends(get_resume_store)
+):
+    """
+    Get a specific resume by ID, with its ETag. Send the ETag back in
+    If-None-Match to get an empty 304 when the resume hasn't changed.
+    """
     try:
-        supabase = get_supabase()
-        result = supabase.table("resumes").select("*").eq("id", resume_id).eq("user_id", user["id"]).execute()
-        if not result.data:
+        if if_none_match:
+            # Only the version columns are read to answer a revalidation
+            current = await store.get_resume(user["id"], resume_id, columns="id,updated_at")
+            if current is None:
+                raise HTTPException(status_code=404, detail="Resume not found")
+            etag = _etag(current)
+            if _etag_matches(if_none_match, etag, weak=True):
+                return Response(status_code=304, headers={"ETag": etag})
+        resume = await store.get_resume(user["id"], resume_id)
+        if resume is None:
             raise HTTPException(status_code=404, detail="Resume not found")
-        return {"resume": result.data[0]}
+        return FastJSONResponse({"resume": resume}, headers={"ETag": _etag(resume)})
     except HTTPException:
         raise
     except Exception as e:
@@ -209,18 +407,80 @@ async def get_resume(resume_id: str, user: dict = Depends(get_current_user)):
 
 
 @app.put("/resumes/{resume_id}")
-async def update_resume(resume_id: str, request: UpdateResumeRequest, user: dict = Depends(get_current_user)):
-    """Update an existing resume."""
+async def update_resume(
+    resume_id: str,
+    request: UpdateResumeRequest,
+    if_match: Optional[str] = Header(None),
+    user: dict = Depends(get_current_user),
+    store=Depends(get_resume_store)
+):
+    """Update an existing resume. With If-Match, fails with 412 if it changed since that ETag."""
     try:
-        supabase = get_supabase()
         update_data = {k: v for k, v in request.model_dump().items() if v is not None}
         if not update_data:
             raise HTTPException(status_code=400, detail="No fields to update")
-        update_data["updated_at"] = "now()"
-        result = supabase.table("resumes").update(update_data).eq("id", resume_id).eq("user_id", user["id"]).execute()
-        if not result.data:
+        updated_at = None
+        if if_match:
+            current = await store.get_resume(user["id"], resume_id, columns="id,updated_at")
+            if current is None:
+                raise HTTPException(status_code=404, detail="Resume not found")
+            _check_if_match(if_match, current)
+            updated_at = current["updated_at"]
+        resume = await store.update_resume(user["id"], resume_id, update_data, if_updated_at=updated_at)
+        if resume is None:
+            if updated_at is not None:
+                raise HTTPException(status_code=412, detail="Resume was modified by another request")
             raise HTTPException(status_code=404, detail="Resume not found")
-        return {"resume": result.data[0]}
+        return FastJSONResponse({"resume": resume}, headers={"ETag": _etag(resume)})
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.patch("/resumes/{resume_id}")
+async def patch_resume(
+    resume_id: str,
+    operations: JSONObjectList = Body(...),
+    if_match: Optional[str] = Header(None),
+    user: dict = Depends(get_current_user),
+    store=Depends(get_resume_store)
+):
+    """
+    Apply a JSON Patch (RFC 6902) to a resume. Paths address the editable
+    fields, e.g. {"op": "replace", "path": "/full_resume/experience/0", "value": ...}.
+    Only the fields the patch changes are written. With If-Match, fails with 412
+    if the resume changed since that ETag; a failed "test" operation gives 409.
+    """
+    try:
+        current = await store.get_resume(user["id"], resume_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        if if_match:
+            _check_if_match(if_match, current)
+        document = {field: current.get(field) for field in EDITABLE_FIELDS}
+        try:
+            patched = apply_patch(document, operations)
+        except PatchTestFailed as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except PatchError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not isinstance(patched, dict) or set(patched) != set(EDITABLE_FIELDS):
+            raise HTTPException(status_code=400, detail=f"Patch may only change {', '.join(EDITABLE_FIELDS)}")
+        # The patched resume must still be something POST /resumes would accept
+        try:
+            SaveResumeRequest.model_validate(patched)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+        changed = {field: patched[field] for field in EDITABLE_FIELDS if not json_equal(patched[field], document[field])}
+        if not changed:
+            return FastJSONResponse({"resume": current}, headers={"ETag": _etag(current)})
+        # Conditional on the version read above, so a concurrent write isn't silently overwritten
+        resume = await store.update_resume(user["id"], resume_id, changed, if_updated_at=current["updated_at"])
+        if resume is None:
+            raise HTTPException(status_code=412, detail="Resume was modified by another request")
+        return FastJSONResponse({"resume": resume}, headers={"ETag": _etag(resume)})
     except HTTPException:
         raise
     except Exception as e:
@@ -228,12 +488,10 @@ async def update_resume(resume_id: str, request: UpdateResumeRequest, user: dict
 
 
 @app.delete("/resumes/{resume_id}")
-async def delete_resume(resume_id: str, user: dict = Depends(get_current_user)):
+async def delete_resume(resume_id: str, user: dict = Depends(get_current_user), store=Depends(get_resume_store)):
     """Delete a resume."""
     try:
-        supabase = get_supabase()
-        result = supabase.table("resumes").delete().eq("id", resume_id).eq("user_id", user["id"]).execute()
-        if not result.data:
+        if not await store.delete_resume(user["id"], resume_id):
             raise HTTPException(status_code=404, detail="Resume not found")
         return {"deleted": True}
     except HTTPException:
@@ -244,15 +502,119 @@ async def delete_resume(resume_id: str, user: dict = Depends(get_current_user)):
 
 # --- Helpers ---
 
-def _get_template_path(template_name: str) -> str:
-    """Get full path to template file."""
-    templates = {
-        "jake": "../data/templates/jake_template.tex",
-        "mirage": "../data/templates/mirage_template.tex",
-    }
-    if template_name not in templates:
+def _prepare_pdf(request: ExportRequest):
+    """(cache key, cached PDF or None, LaTeX to compile on a miss) for /export/pdf."""
+    resume = Resume(request.resume)
+    template = _get_template(request.template)
+    key = render_key(template.source, resume.to_dict(), "pdf")
+    pdf_bytes = render_cache.get(key)
+    if pdf_bytes is not None:
+        return key, pdf_bytes, None
+    return key, None, resumer.resume_to_latex(resume, template)
+
+
+def _etag(row: dict) -> str:
+    """Strong ETag of a saved resume; updated_at changes on every write."""
+    digest = hashlib.sha256(f"{row['id']}:{row['updated_at']}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(header: str, etag: str, weak: bool = False) -> bool:
+    """
+    Whether an If-Match / If-None-Match header lists this ETag (or is *).
+    If-None-Match compares weakly (W/ prefixes ignored); If-Match strongly, so a
+    weak tag never matches (RFC 9110 13.1.1).
+    """
+    tags = [tag.strip() for tag in header.split(",")]
+    if weak:
+        tags = [tag.removeprefix("W/") for tag in tags]
+    return "*" in tags or etag in tags
+
+
+def _check_if_match(header: str, current: dict):
+    if not _etag_matches(header, _etag(current)):
+        raise HTTPException(status_code=412, detail="Resume was modified since it was loaded", headers={"ETag": _etag(current)})
+
+
+def _encode_cursor(row: dict) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps([row["updated_at"], row["id"]])).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        updated_at, resume_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        # Both values end up in a PostgREST filter: accept only a timestamp and a UUID
+        datetime.fromisoformat(updated_at)
+        uuid.UUID(resume_id)
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return updated_at, resume_id
+
+
+def _require_model():
+    """503 until the embedding model is loaded, starting the load if needed."""
+    if resumer.model_ready:
+        return
+    error = resumer.load_error
+    resumer.start_loading()
+    if error is not None:
+        raise HTTPException(status_code=503, detail=f"Embedding model failed to load: {error}")
+    raise HTTPException(status_code=503, detail="Embedding model is warming up, retry shortly", headers={"Retry-After": "5"})
+
+
+def _tailor_events(request: TailorRequest, base, fit):
+    """NDJSON lines for /tailor/stream."""
+    omit = request.omit_null_metrics
+    try:
+        for event, payload in resumer.tailor_stream(
+            request.resume,
+            request.job_description,
+            request.exp_bullet_count,
+            request.proj_bullet_count,
+            request.tech_count,
+            request.lang_count,
+            base=base,
+            fit=fit
+        ):
+            if event == "skills":
+                record = {
+                    "event": event,
+                    "technologies": [item.to_dict(omit) for item in payload.techs],
+                    "languages": [item.to_dict(omit) for item in payload.languages],
+                }
+            elif event == "section":
+                kind, index, section = payload
+                record = {"event": event, "kind": kind, "index": index, "section": section.to_dict(omit)}
+            else:
+                tailored, state = payload
+                version = request.base_version if state is base else tailor_cache.put(state)
+                record = {"event": event, "version": version, "resume": tailored.to_dict(omit)}
+            yield ndjson_line(record)
+    except Exception as e:
+        yield ndjson_line({"event": "error", "detail": _error_detail(e)})
+
+
+def _error_detail(e: Exception) -> str:
+    """Client-facing message for a tailoring failure; a KeyError is a missing resume field."""
+    if isinstance(e, KeyError):
+        return f"Missing resume field: {e.args[0]}"
+    return str(e)
+
+
+def _fit_metrics(request: TailorRequest):
+    """Page metrics for a fit-to-page request, None otherwise."""
+    if not request.fit:
+        return None
+    _get_template(request.template)
+    return page_metrics(request.template)
+
+
+def _get_template(template_name: str) -> CompiledTemplate:
+    """Get a compiled template by name."""
+    template = templates.get(template_name)
+    if template is None:
         raise HTTPException(status_code=400, detail=f"Unknown template: {template_name}")
-    return templates[template_name]
+    return template
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+Token verification cost against a local stand-in issuer: an HS256 secret and an
+ES256 key published as a JWKS over HTTP on localhost. The remote Supabase check
+is simulated by a fallback that sleeps --remote-ms. The Issuer is the one
+tests/test_jwt_verifier.py uses (tests/issuer.py).
+
+Usage (from backend/): python benchmarks/bench_auth.py [--runs 2000] [--remote-ms 40]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import timeit
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+sys.path.insert(1, os.path.join(BACKEND, "tests"))
+
+from issuer import SECRET, Issuer  # noqa: E402
+from jwt_verifier import JWTVerifier  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--remote-ms", type=float, default=40)
+    args = parser.parse_args()
+
+    issuer = Issuer()
+
+    async def remote(token):
+        await asyncio.sleep(args.remote_ms / 1000)
+        return {"id": "user-1", "email": "jane@example.com"}
+
+    def verifier(**kwargs):
+        return JWTVerifier(secret=SECRET, jwks_url=issuer.jwks_url, fallback=remote, **kwargs)
+
+    hs_token, es_token = issuer.token(), issuer.token(alg="ES256")
+    cases = {
+        "HS256, uncached": (lambda: verifier(ttl=0), hs_token),
+        "ES256 via JWKS, uncached": (lambda: verifier(ttl=0), es_token),
+        "cached (any alg)": (lambda: verifier(), hs_token),
+    }
+    loop = asyncio.new_event_loop()
+    for name, (make, token) in cases.items():
+        v = make()
+        loop.run_until_complete(v.verify(token))  # warm: JWKS fetch, cache fill
+
+        async def batch(v=v, token=token):
+            for _ in range(args.runs):
+                await v.verify(token)
+
+        seconds = min(timeit.repeat(lambda: loop.run_until_complete(batch()), number=1, repeat=3))
+        print(f"{name:<26}{seconds / args.runs * 1e6:>10.1f} us")
+    loop.close()
+    print(f"{'remote check (simulated)':<26}{args.remote_ms * 1000:>10.1f} us")
+    issuer.server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
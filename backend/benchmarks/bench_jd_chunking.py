@@ -0,0 +1,75 @@
+"""
+Job description encoding latency vs. length, whole-text vs. chunked, and how
+closely chunked pooling reproduces whole-text bullet rankings. Long postings
+are built by concatenating the bundled job descriptions.
+
+Usage (from backend/): python benchmarks/bench_jd_chunking.py [--lengths 1000 4000 16000 32000] [--runs 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_cache import EmbeddingCache  # noqa: E402
+from eval_backends import sample_texts  # noqa: E402
+from relevance import Relevance, chunk_text  # noqa: E402
+
+
+def posting_of_length(seeds: list[str], length: int) -> str:
+    text = ""
+    while len(text) < length:
+        text += "\n".join(seeds) + "\n"
+    # Cut at a line break so the posting stays well-formed
+    return text[:text.rfind("\n", 0, length) + 1 or length]
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.corrcoef(np.argsort(np.argsort(a)), np.argsort(np.argsort(b)))[0, 1])
+
+
+def time_cold(relevance: Relevance, bullets: list[str], job_description: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        # Fresh JD cache each run so every chunk is encoded; bullets stay cached
+        relevance._target_cache = EmbeddingCache(max_entries=100000, dtype=relevance.dtype.name)
+        start = time.perf_counter()
+        relevance.calculate_similarities(bullets, job_description)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lengths", nargs="+", type=int, default=[1000, 4000, 16000, 32000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    bullets, seeds = sample_texts()
+    engines = {mode: Relevance(cache_dir="", chunk_pooling=mode) for mode in Relevance.CHUNK_POOLING}
+    for relevance in engines.values():
+        relevance.calculate_similarities(bullets, "warm-up")
+
+    print(f"{len(bullets)} bullets; chunks of at most {engines['mean'].chunk_chars} chars")
+    print(f"{'chars':>7}{'chunks':>8}" + "".join(f"{mode + ' ms':>10}" for mode in engines))
+    for length in args.lengths:
+        posting = posting_of_length(seeds, length)
+        row = f"{len(posting):>7}{len(chunk_text(posting, engines['mean'].chunk_chars, engines['mean'].max_chunks)):>8}"
+        row += "".join(f"{time_cold(relevance, bullets, posting, args.runs):>10.0f}" for relevance in engines.values())
+        print(row)
+
+    print("\nRanking agreement with whole-text encoding on the bundled job descriptions (spearman)")
+    for seed in seeds:
+        reference = np.array(engines["off"].calculate_similarities(bullets, seed))
+        scores = "  ".join(
+            f"{mode} {spearman(np.array(engines[mode].calculate_similarities(bullets, seed)), reference):.3f}"
+            for mode in ("mean", "max")
+        )
+        print(f"{len(seed):>7} chars  {scores}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Keyword scoring: per-keyword regex search vs. the shared token matcher.
+
+Usage (from backend/): python benchmarks/bench_keywords.py [--keywords 200] [--runs 200]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keywords import keyword_matcher  # noqa: E402
+
+DATA_FILE = "../data/data.json"
+JOB_DESCRIPTIONS = ["../data/job_desc_ML.txt", "../data/job_desc_SWE.txt"]
+
+
+def legacy_scores(keywords: tuple[str, ...], job_description: str) -> list[float]:
+    return [1.0 if re.search(rf"\b{re.escape(kw)}\b", job_description, re.IGNORECASE) else 0.0 for kw in keywords]
+
+
+def matcher_scores(keywords: tuple[str, ...], job_description: str) -> list[float]:
+    return [1.0 if count else 0.0 for count in keyword_matcher(keywords).counts(job_description)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keywords", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(DATA_FILE) as f:
+        data = json.load(f)
+    sample = [item["text"] for section in ("technologies", "languages") for item in data[section]]
+    keywords = tuple((sample * (args.keywords // len(sample) + 1))[:args.keywords])
+    job_descriptions = []
+    for path in JOB_DESCRIPTIONS:
+        with open(path) as f:
+            job_descriptions.append(f.read())
+
+    for path, job_description in zip(JOB_DESCRIPTIONS, job_descriptions):
+        legacy = legacy_scores(keywords, job_description)
+        new = matcher_scores(keywords, job_description)
+        changed = sorted({kw for kw, a, b in zip(keywords, legacy, new) if a != b})
+        print(f"{os.path.basename(path)}: {sum(new):.0f}/{len(keywords)} matched, differs from regex on {changed or 'none'}")
+
+    for name, fn in {"regex per keyword": legacy_scores, "token matcher": matcher_scores}.items():
+        seconds = min(timeit.repeat(lambda: [fn(keywords, jd) for jd in job_descriptions], number=args.runs, repeat=3))
+        print(f"{name:<20}{seconds / args.runs * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
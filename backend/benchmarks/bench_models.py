@@ -0,0 +1,71 @@
+"""
+Model construction, serialization (to_dict and the orjson response body)
+and copy cost on large synthetic resumes.
+
+Usage (from backend/): python benchmarks/bench_models.py [--sections 50] [--bullets 20]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Resume  # noqa: E402
+
+
+def synthetic_resume_dict(sections: int, bullets: int) -> dict:
+    def bullet_list(section):
+        return [{"text": f"Shipped feature {section}.{j} for the platform team", "impressiveness": 0.5} for j in range(bullets)]
+
+    return {
+        "full_name": "Jane Doe",
+        "contacts": {"email": "jane@example.com"},
+        "education": [{"est_name": "State University", "degree": "B.Sc.", "gpa": 3.8, "year": "2024"}],
+        "experience": [
+            {"employer": f"Employer {i}", "title": "Engineer", "location": "Remote", "duration": "2020 - 2024", "bullets": bullet_list(f"e{i}")}
+            for i in range(sections)
+        ],
+        "projects": [{"title": f"Project {i}", "languages": ["Python"], "bullets": bullet_list(f"p{i}")} for i in range(sections)],
+        "technologies": [{"text": f"Tech {i}"} for i in range(50)],
+        "languages": [{"text": f"Lang {i}"} for i in range(20)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--bullets", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    # Parse from JSON so inputs look like request bodies
+    data = json.loads(json.dumps(synthetic_resume_dict(args.sections, args.bullets)))
+    resume = Resume(data)
+    print(f"{2 * args.sections} sections, {2 * args.sections * args.bullets} bullets")
+
+    cases = {
+        "construct": lambda: Resume(data),
+        "to_dict": lambda: resume.to_dict(),
+        "dumps(to_dict())": lambda: orjson.dumps(resume.to_dict()),
+        "copy": lambda: resume.copy(),
+        "Resume(to_dict())": lambda: Resume(resume.to_dict()),
+    }
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=args.runs, repeat=3))
+        print(f"{name:<20}{seconds / args.runs * 1000:>10.3f} ms")
+
+    tracemalloc.start()
+    kept = Resume(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'resident size':<20}{size / 1024:>10.1f} KiB")
+    del kept
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+PDF export latency per template: fixed two pdflatex passes vs. rerun-on-demand.
+
+Usage (from backend/): python benchmarks/bench_pdf_passes.py [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from renderer import MAX_PASSES, needs_rerun, pdflatex_command  # noqa: E402
+from resumer import Resumer  # noqa: E402
+
+TEMPLATES = {
+    "jake": "../data/templates/jake_template.tex",
+    "mirage": "../data/templates/mirage_template.tex",
+}
+
+
+def compile_latex(latex: str, fixed_passes: int | None) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tex_file = os.path.join(temp_dir, "resume.tex")
+        with open(tex_file, "w") as f:
+            f.write(latex)
+        start = time.perf_counter()
+        passes = 0
+        for _ in range(fixed_passes or MAX_PASSES):
+            subprocess.run(pdflatex_command(temp_dir, tex_file), capture_output=True, check=True)
+            passes += 1
+            if fixed_passes is None and not needs_rerun(os.path.join(temp_dir, "resume.log")):
+                break
+        return time.perf_counter() - start, passes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    resumer = Resumer()
+    resume = resumer.load_resume()
+
+    print(f"{'template':<10}{'mode':<10}{'passes':>8}{'median ms':>12}")
+    for name, path in TEMPLATES.items():
+        latex = resumer.resume_to_latex_from_template(resume, path)
+        for mode, fixed in (("fixed", 2), ("adaptive", None)):
+            timings = [compile_latex(latex, fixed) for _ in range(args.runs)]
+            median = sorted(t for t, _ in timings)[len(timings) // 2]
+            print(f"{name:<10}{mode:<10}{timings[0][1]:>8}{median * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
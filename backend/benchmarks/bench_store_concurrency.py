@@ -0,0 +1,102 @@
+"""
+Event-loop blocking in the resume CRUD path: N concurrent "list resumes" calls
+against a local stand-in for PostgREST that answers after --latency-ms, made
+(a) with a synchronous HTTP client inside async code, as the handlers used to,
+and (b) through SupabaseResumeStore's pooled async client. A ticker task
+measures how late the event loop runs it, i.e. how long other requests stall.
+
+Usage (from backend/): python benchmarks/bench_store_concurrency.py [--requests 50] [--latency-ms 50]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_store import SupabaseResumeStore  # noqa: E402
+
+
+def start_postgrest(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = b'[{"id": "1", "name": "Resume", "created_at": "2024-01-01", "updated_at": "2024-01-01"}]'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 128  # the default backlog of 5 drops bursts of connections
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(calls, tick: float = 0.005) -> tuple[float, float]:
+    """Wall time for all calls and the worst event-loop stall seen meanwhile."""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            worst = max(worst, time.perf_counter() - start - tick)
+
+    ticking = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for call in calls))
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticking
+    return elapsed, worst
+
+
+async def main_async(args):
+    server = start_postgrest(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    params = {"select": "id,name,created_at,updated_at", "user_id": "eq.user-1", "order": "updated_at.desc"}
+
+    with httpx.Client(base_url=base_url) as sync_client:
+        async def blocking_call():
+            return sync_client.get("/rest/v1/resumes", params=params).json()
+
+        sync_elapsed, sync_stall = await run([blocking_call] * args.requests)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=args.pool)) as client:
+        store = SupabaseResumeStore(client, "service-key")
+        async_elapsed, async_stall = await run([lambda: store.list_resumes("user-1")] * args.requests)
+
+    server.shutdown()
+    print(f"{args.requests} concurrent list calls, {args.latency_ms:.0f} ms per database round-trip")
+    print(f"{'client':<28}{'total ms':>10}{'worst loop stall ms':>22}")
+    print(f"{'sync client in async code':<28}{sync_elapsed * 1000:>10.0f}{sync_stall * 1000:>22.0f}")
+    print(f"{'SupabaseResumeStore':<28}{async_elapsed * 1000:>10.0f}{async_stall * 1000:>22.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--pool", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Calibrate page_fit.PAGE_METRICS for a template.
+
+widths:  chars_per_line from the bullet font's AFM widths (cmr10.afm for jake,
+         ptmr8a.afm for mirage; both ship with TeX Live and matplotlib). Sample
+         bullets and job-description windows are wrapped the way TeX fills a
+         line; the result is the largest chars_per_line that undercounts lines
+         for at most --tolerance of the samples.
+heights: every vertical metric, measured with pdflatex. Probe documents that
+         differ by one entry or bullet are compiled and their \\pagetotal compared.
+
+Usage (from backend/):
+    python benchmarks/calibrate_page_fit.py widths --afm ptmr8a.afm --line-width 525.5
+    python benchmarks/calibrate_page_fit.py heights [--template jake]
+"""
+import argparse
+import copy
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from latex_template import load_template  # noqa: E402
+from models import Resume  # noqa: E402
+from page_fit import PAGE_METRICS  # noqa: E402
+from resumer import Resumer  # noqa: E402
+
+DATA = "../data/data.json"
+JOB_DESCRIPTIONS = ["../data/job_desc_ML.txt", "../data/job_desc_SWE.txt"]
+TEMPLATES = {
+    "jake": "../data/templates/jake_template.tex",
+    "mirage": "../data/templates/mirage_template.tex",
+}
+
+ONE_LINE = "Built a small internal tool."
+TWO_LINES = " ".join(["Designed and shipped a reporting service that aggregates usage metrics"] * 2)
+_PROBE = re.compile(rb"PAGEFIT ([\d.]+)pt ([\d.]+)pt (\d+)")
+
+
+# --- widths ---
+
+def load_afm_widths(path: str) -> dict[str, float]:
+    """Advance widths (1/1000 em) of the printable ASCII characters in an AFM file."""
+    widths = {}
+    with open(path, errors="ignore") as f:
+        for line in f:
+            if not line.startswith("C "):
+                continue
+            fields = dict(part.strip().split(" ", 1) for part in line.split(";") if " " in part.strip())
+            code = int(fields["C"])
+            if 32 <= code < 127:
+                widths[chr(code)] = float(fields["WX"])
+    return widths
+
+
+def wrapped_lines(text: str, widths: dict[str, float], font_size: float, line_width: float) -> int:
+    """Lines TeX needs for `text`, filling greedily and letting interword space shrink by a third."""
+    space = widths.get(" ", 333) * font_size / 1000
+    lines, used = 1, None
+    for word in text.split():
+        width = sum(widths.get(char, 500) for char in word) * font_size / 1000
+        if used is None:
+            used = width
+        elif used + space * 2 / 3 + width <= line_width:
+            used += space + width
+        else:
+            lines, used = lines + 1, width
+    return lines
+
+
+def sample_texts() -> list[str]:
+    with open(DATA) as f:
+        data = json.load(f)
+    texts = [bullet["text"] for section in data["experience"] + data["projects"] for bullet in section["bullets"]]
+    prose = " ".join(open(path).read() for path in JOB_DESCRIPTIONS)
+    prose = re.sub(r"\s+", " ", prose)
+    for length in range(80, 330, 15):
+        texts += [prose[i:i + length].strip() for i in range(0, len(prose) - length, 97)]
+    return texts
+
+
+def calibrate_widths(afm: str, line_width: float, font_size: float, tolerance: float):
+    widths = load_afm_widths(afm)
+    texts = sample_texts()
+    lines = [wrapped_lines(text, widths, font_size, line_width) for text in texts]
+    best = None
+    for chars_per_line in range(60, 200):
+        under = sum(math.ceil(len(text) / chars_per_line) < n for text, n in zip(texts, lines)) / len(texts)
+        if under <= tolerance:
+            best = chars_per_line
+    print(f"{len(texts)} samples, {sum(lines)} lines: chars_per_line={best}")
+
+
+# --- heights ---
+
+def pagetotal(latex: str) -> tuple[float, float]:
+    """(\\pagetotal at the end of the document, \\textheight) in points; the document must fit one page."""
+    probe = "\\par\\penalty0\\typeout{PAGEFIT \\the\\pagetotal\\space\\the\\textheight\\space\\thepage}\n\\end{document}"
+    head, _, tail = latex.rpartition("\\end{document}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tex_file = os.path.join(temp_dir, "probe.tex")
+        with open(tex_file, "w") as f:
+            f.write(head + probe + tail)
+        subprocess.run(["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, tex_file], capture_output=True)
+        with open(os.path.join(temp_dir, "probe.log"), "rb") as f:
+            match = _PROBE.search(f.read())
+    if match is None:
+        raise RuntimeError("pdflatex did not reach the probe")
+    if match.group(3) != b"1":
+        raise RuntimeError("probe document ran past one page")
+    return float(match.group(1)), float(match.group(2))
+
+
+def calibrate_heights(template_name: str):
+    with open(DATA) as f:
+        data = json.load(f)
+    template = load_template(TEMPLATES[template_name])
+    resumer = Resumer()
+    empty = {**data, "education": [], "experience": [], "projects": [], "languages": [], "technologies": []}
+
+    def measure(**fields) -> float:
+        return pagetotal(resumer.resume_to_latex(Resume(copy.deepcopy({**empty, **fields})), template))[0]
+
+    def entries(source: dict, *bullets: str) -> dict:
+        return {**source, "bullets": [{"text": text, "impressiveness": 0.5} for text in bullets]}
+
+    experience, project = data["experience"][0], data["projects"][0]
+    base, page_height = pagetotal(resumer.resume_to_latex(Resume(copy.deepcopy(empty)), template))
+    one = measure(experience=[entries(experience, ONE_LINE)])
+    bullet = measure(experience=[entries(experience, ONE_LINE, ONE_LINE)]) - one
+    line_height = measure(experience=[entries(experience, ONE_LINE, TWO_LINES)]) - one - bullet
+    experience_heading = measure(experience=[entries(experience, ONE_LINE)] * 2) - one - bullet
+    project_one = measure(projects=[entries(project, ONE_LINE)])
+    project_heading = measure(projects=[entries(project, ONE_LINE)] * 2) - project_one - bullet
+    education_entry = measure(education=data["education"][:2]) - measure(education=data["education"][:1])
+
+    section_title = PAGE_METRICS[template_name].section_title
+    print(f"page_height={page_height:.1f}  header={base - 4 * section_title - 2 * line_height:.1f} (with section_title={section_title})")
+    print(f"education_entry={education_entry:.1f}  experience_heading={experience_heading:.1f}  project_heading={project_heading:.1f}")
+    print(f"line_height={line_height:.1f}  bullet_gap={bullet - line_height:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    modes = parser.add_subparsers(dest="mode", required=True)
+    widths = modes.add_parser("widths")
+    widths.add_argument("--afm", required=True)
+    widths.add_argument("--line-width", type=float, required=True, help="bullet line width in points")
+    widths.add_argument("--font-size", type=float, default=10.0)
+    widths.add_argument("--tolerance", type=float, default=0.0)
+    heights = modes.add_parser("heights")
+    heights.add_argument("--template", choices=sorted(TEMPLATES), default="jake")
+    args = parser.parse_args()
+
+    if args.mode == "widths":
+        calibrate_widths(args.afm, args.line_width, args.font_size, args.tolerance)
+    else:
+        calibrate_heights(args.template)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare embedding backends (torch fp32, ONNX Runtime, int8 dynamic quantization)
+on the bundled sample data: load time, memory, encode latency and agreement with
+the fp32 embeddings.
+
+Usage (from backend/): python benchmarks/eval_backends.py [--backends torch onnx int8] [--runs 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from relevance import Relevance  # noqa: E402
+
+DATA_FILE = "../data/data.json"
+JOB_DESCRIPTIONS = ["../data/job_desc_ML.txt", "../data/job_desc_SWE.txt"]
+
+
+def sample_texts() -> tuple[list[str], list[str]]:
+    with open(DATA_FILE) as f:
+        data = json.load(f)
+    bullets = [b["text"] for section in ("experience", "projects") for item in data[section] for b in item["bullets"]]
+    job_descriptions = []
+    for path in JOB_DESCRIPTIONS:
+        with open(path) as f:
+            job_descriptions.append(f.read())
+    return bullets, job_descriptions
+
+
+def unit(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    return x / np.linalg.norm(x, axis=-1, keepdims=True)
+
+
+def evaluate(backend: str, bullets: list[str], job_descriptions: list[str], runs: int) -> dict:
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    start = time.perf_counter()
+    # No cache: every encode below must hit the model
+    relevance = Relevance(backend=backend, cache_dir="")
+    load_seconds = time.perf_counter() - start
+
+    model = relevance.model
+    model.encode(bullets[:2], prompt_name="query")  # warm-up
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        bullet_embeddings = model.encode(bullets, prompt_name="query")
+        jd_embeddings = model.encode(job_descriptions)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "load_s": load_seconds,
+        "encode_ms": sorted(timings)[len(timings) // 2] * 1000,
+        "rss_mb": (process.memory_info().rss - rss_before) / 2**20,
+        "bullets": unit(bullet_embeddings),
+        "jds": unit(jd_embeddings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=list(Relevance.BACKENDS))
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    bullets, job_descriptions = sample_texts()
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    results = {}
+    for backend in backends:
+        try:
+            results[backend] = evaluate(backend, bullets, job_descriptions, args.runs)
+        except RuntimeError as e:
+            print(f"{backend}: skipped ({e})")
+
+    reference = results["torch"]
+    reference_sims = reference["bullets"] @ reference["jds"].T
+    print(f"{len(bullets)} bullets x {len(job_descriptions)} job descriptions")
+    print(f"{'backend':<8}{'load s':>8}{'encode ms':>11}{'+RSS MB':>9}{'cos mean':>10}{'cos min':>9}{'top5 agree':>12}")
+    for backend, result in results.items():
+        cosines = np.concatenate([
+            np.sum(result["bullets"] * reference["bullets"], axis=1),
+            np.sum(result["jds"] * reference["jds"], axis=1),
+        ])
+        sims = result["bullets"] @ result["jds"].T
+        # Share of each JD's top-5 bullets that match the fp32 top-5
+        agreement = np.mean([
+            len(set(np.argsort(-sims[:, j])[:5]) & set(np.argsort(-reference_sims[:, j])[:5])) / 5
+            for j in range(len(job_descriptions))
+        ])
+        print(f"{backend:<8}{result['load_s']:>8.1f}{result['encode_ms']:>11.1f}{result['rss_mb']:>9.0f}"
+              f"{cosines.mean():>10.4f}{cosines.min():>9.4f}{agreement:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
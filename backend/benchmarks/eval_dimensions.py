@@ -0,0 +1,58 @@
+"""
+Quality vs. embedding width on the bundled sample data: how closely truncated,
+float16 embeddings reproduce the full-width fp32 bullet rankings per job description.
+
+Usage (from backend/): python benchmarks/eval_dimensions.py [--dims 1024 768 512 256 128 64]
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eval_backends import sample_texts  # noqa: E402
+from relevance import Relevance  # noqa: E402
+
+
+def truncate(embeddings: np.ndarray, dim: int, dtype: str) -> np.ndarray:
+    x = embeddings[:, :dim]
+    x = x / np.linalg.norm(x, axis=1, keepdims=True)
+    return x.astype(dtype).astype(np.float32)
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    rank_a = np.argsort(np.argsort(a))
+    rank_b = np.argsort(np.argsort(b))
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dims", nargs="+", type=int, default=[1024, 768, 512, 256, 128, 64, 32])
+    args = parser.parse_args()
+
+    bullets, job_descriptions = sample_texts()
+    model = Relevance(cache_dir="", dtype="float32").model
+    bullet_embeddings = np.asarray(model.encode(bullets, prompt_name="query"), dtype=np.float32)
+    jd_embeddings = np.asarray(model.encode(job_descriptions), dtype=np.float32)
+    full_dim = bullet_embeddings.shape[1]
+    reference = truncate(bullet_embeddings, full_dim, "float32") @ truncate(jd_embeddings, full_dim, "float32").T
+
+    print(f"{len(bullets)} bullets x {len(job_descriptions)} job descriptions, full width {full_dim}")
+    print(f"{'dim':>6}{'bytes/vec':>11}{'spearman':>10}{'top5 agree':>12}{'max |dsim|':>12}")
+    for dim in sorted((d for d in args.dims if d <= full_dim), reverse=True):
+        sims = truncate(bullet_embeddings, dim, "float16") @ truncate(jd_embeddings, dim, "float16").T
+        rho = np.mean([spearman(sims[:, j], reference[:, j]) for j in range(len(job_descriptions))])
+        agreement = np.mean([
+            len(set(np.argsort(-sims[:, j])[:5]) & set(np.argsort(-reference[:, j])[:5])) / 5
+            for j in range(len(job_descriptions))
+        ])
+        # Similarities are reported to clients on a [0, 1] scale
+        drift = np.max(np.abs(sims - reference)) / 2
+        print(f"{dim:>6}{dim * 2:>11}{rho:>10.3f}{agreement:>12.2f}{drift:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Two-tier embedding cache: a bounded in-memory LRU backed by a persistent,
+memory-mapped vector store shared between worker processes.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked appends
+    fcntl = None
+
+
+def make_key(model_name: str, prompt_name: str | None, text: str) -> str:
+    """Stable cache key for an embedding of `text` under a model and prompt."""
+    payload = f"{model_name}\x00{prompt_name or ''}\x00{text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskVectorStore:
+    """
+    Append-only vector store: raw rows in `vectors.bin`, one "key row" line per
+    vector in `index.txt`. Rows are read through a memory map and the index is
+    tailed so vectors written by other workers become visible. Rows left without
+    an index line by a crashed writer are never referenced, so later keys stay
+    aligned with their own vectors.
+    """
+
+    def __init__(self, path: str, dtype: str = "float32"):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        os.makedirs(path, exist_ok=True)
+        self._vectors_path = os.path.join(path, "vectors.bin")
+        self._index_path = os.path.join(path, "index.txt")
+        self._meta_path = os.path.join(path, "meta.json")
+        self._lock_path = os.path.join(path, ".lock")
+        self._rows: dict[str, int] = {}
+        self._index_offset = 0
+        self._dim: int | None = None
+        self._mmap = None
+        self._lock = threading.Lock()
+        self._load_meta()
+        self._refresh_index()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        with self._lock:
+            if any(key not in self._rows for key in keys):
+                self._refresh_index()
+            found = {}
+            for key in keys:
+                row = self._rows.get(key)
+                if row is None:
+                    continue
+                vectors = self._vectors(row)
+                if vectors is not None:
+                    found[key] = np.array(vectors[row])
+            return found
+
+    def put_many(self, items: list[tuple[str, np.ndarray]]):
+        if not items:
+            return
+        with self._lock, self._file_lock():
+            self._refresh_index()
+            items = [(k, v) for k, v in items if k not in self._rows]
+            if not items:
+                return
+            if self._dim is None:
+                self._load_meta()
+            if self._dim is None:
+                self._dim = int(np.asarray(items[0][1]).shape[-1])
+                with open(self._meta_path, "w") as f:
+                    json.dump({"dim": self._dim, "dtype": self.dtype.name}, f)
+            matrix = np.stack([np.asarray(v, dtype=self.dtype).reshape(self._dim) for _, v in items])
+            start = self._discard_partial_writes()
+            # Vectors are written before their keys so the index never points past the data
+            with open(self._vectors_path, "ab") as f:
+                f.write(matrix.tobytes())
+                f.flush()
+            with open(self._index_path, "a") as f:
+                f.write("".join(f"{k} {start + i}\n" for i, (k, _) in enumerate(items)))
+            self._refresh_index()
+
+    def _discard_partial_writes(self) -> int:
+        """
+        Under the file lock: drop a torn index line or vector row left by a
+        writer that crashed mid-append. Returns the row the next vector gets.
+        """
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+        if not os.path.exists(self._vectors_path):
+            return 0
+        row_bytes = self._dim * self.dtype.itemsize
+        size = os.path.getsize(self._vectors_path)
+        if size % row_bytes:
+            with open(self._vectors_path, "rb+") as f:
+                f.truncate(size - size % row_bytes)
+        return size // row_bytes
+
+    def _load_meta(self):
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                meta = json.load(f)
+            if np.dtype(meta["dtype"]) != self.dtype:
+                raise RuntimeError(f"Embedding store at '{self.path}' holds {meta['dtype']} vectors, expected {self.dtype.name}")
+            self._dim = meta["dim"]
+
+    def _refresh_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "rb") as f:
+            f.seek(self._index_offset)
+            chunk = f.read()
+        # Ignore a trailing partial line still being written by another process
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        for line in complete.decode("ascii").splitlines():
+            key, row = line.split(" ")
+            self._rows.setdefault(key, int(row))
+        self._index_offset += len(complete)
+
+    def _vectors(self, row: int):
+        if self._dim is None:
+            self._load_meta()
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            rows = os.path.getsize(self._vectors_path) // (self._dim * self.dtype.itemsize)
+            if row >= rows:
+                return None
+            self._mmap = np.memmap(self._vectors_path, dtype=self.dtype, mode="r", shape=(rows, self._dim))
+        return self._mmap
+
+    def _file_lock(self):
+        return _FileLock(self._lock_path)
+
+
+class _FileLock:
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = open(self.path, "a")
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._fd.close()
+
+
+class EmbeddingCache:
+    """
+    LRU of embedding vectors bounded by entry count and/or total bytes, with an
+    optional DiskVectorStore behind it. Misses in memory fall through to disk.
+    """
+
+    def __init__(self, path: str | None = None, max_entries: int | None = 10000, max_bytes: int | None = None, dtype: str = "float32"):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.dtype = np.dtype(dtype)
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.store = DiskVectorStore(path, dtype) if path else None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else None,
+        }
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+        if self.store is not None and missing:
+            from_disk = self.store.get_many(missing)
+            self._remember(from_disk.items())
+            found.update(from_disk)
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]):
+        # Copy: a row view would keep the caller's whole batch array alive
+        items = {k: np.array(v, dtype=self.dtype, copy=True) for k, v in items.items()}
+        self._remember(items.items())
+        if self.store is not None:
+            self.store.put_many(list(items.items()))
+
+    def _remember(self, items):
+        with self._lock:
+            for key, vector in items:
+                old = self._memory.pop(key, None)
+                if old is not None:
+                    self._bytes -= old.nbytes
+                self._memory[key] = vector
+                self._bytes += vector.nbytes
+            self._evict()
+
+    def _evict(self):
+        while self._memory and (
+            (self.max_entries is not None and len(self._memory) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, vector = self._memory.popitem(last=False)
+            self._bytes -= vector.nbytes
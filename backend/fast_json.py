@@ -0,0 +1,45 @@
+"""
+orjson-backed request parsing and responses for the JSON-heavy endpoints.
+"""
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+def ndjson_line(content: Any) -> bytes:
+    """One newline-terminated JSON record for streamed (NDJSON) responses."""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+
+
+class FastJSONResponse(Response):
+    """
+    Serializes with orjson. Return it directly from an endpoint: FastAPI then
+    skips jsonable_encoder, which would otherwise walk the whole resume first.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class _FastJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI still answers 422
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    """Route class that parses JSON request bodies with orjson."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def fast_json_handler(request: Request) -> Response:
+            return await handler(_FastJSONRequest(request.scope, request.receive))
+
+        return fast_json_handler
@@ -0,0 +1,126 @@
+"""
+JSON Patch (RFC 6902) for saved resumes.
+"""
+import copy
+
+
+class PatchError(ValueError):
+    pass
+
+
+class PatchTestFailed(PatchError):
+    pass
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if not isinstance(pointer, str):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not (token.isascii() and token.isdigit()) or (token != "0" and token.startswith("0")):
+        raise PatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve(document, tokens: list[str]):
+    """The value the tokens point at."""
+    for token in tokens:
+        if isinstance(document, dict):
+            if token not in document:
+                raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+            document = document[token]
+        elif isinstance(document, list):
+            document = document[_index(document, token)]
+        else:
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+    return document
+
+
+def _add(document, tokens: list[str], value):
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, tokens[-1], allow_end=True), value)
+    else:
+        raise PatchError(f"Cannot add to a scalar at /{'/'.join(tokens[:-1])}")
+    return document
+
+
+def _remove(document, tokens: list[str]):
+    if not tokens:
+        raise PatchError("Cannot remove the whole document")
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        if tokens[-1] not in parent:
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+        return parent.pop(tokens[-1])
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, tokens[-1]))
+    raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+
+
+def json_equal(a, b) -> bool:
+    """JSON equality for "test": like ==, but true/false never equal 1/0."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (dict, list)) or isinstance(b, (dict, list)):
+        return False
+    return a == b
+
+
+def apply_patch(document, operations: list[dict]):
+    """
+    Apply `operations` to a copy of `document` and return it. Raises PatchError
+    for malformed operations or missing paths, PatchTestFailed when a "test"
+    operation doesn't match; the original document is never modified.
+    """
+    document = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+            raise PatchError(f"Invalid patch operation: {operation!r}")
+        op = operation["op"]
+        tokens = _parse_pointer(operation["path"])
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise PatchError(f"'{op}' needs a value")
+        if op in ("move", "copy") and "from" not in operation:
+            raise PatchError(f"'{op}' needs a from path")
+
+        if op == "add":
+            document = _add(document, tokens, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(document, tokens)
+        elif op == "replace":
+            if tokens:
+                _remove(document, tokens)
+            document = _add(document, tokens, copy.deepcopy(operation["value"]))
+        elif op == "move":
+            source = _parse_pointer(operation["from"])
+            if tokens[:len(source)] == source and tokens != source:
+                raise PatchError("Cannot move a value into itself")
+            document = _add(document, tokens, _remove(document, source))
+        elif op == "copy":
+            document = _add(document, tokens, copy.deepcopy(_resolve(document, _parse_pointer(operation["from"]))))
+        elif op == "test":
+            if not json_equal(_resolve(document, tokens), operation["value"]):
+                raise PatchTestFailed(f"Test failed at {operation['path']}")
+        else:
+            raise PatchError(f"Unknown patch operation: {op!r}")
+    return document
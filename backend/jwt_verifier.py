@@ -0,0 +1,128 @@
+"""
+Local verification of Supabase access tokens.
+
+HS256 tokens are checked against the project's JWT secret and asymmetric
+tokens (RS256/ES256) against the project's JWKS, fetched once and cached; only
+that fetch leaves the event loop. Verified tokens are remembered for a short TTL, so repeat requests cost one
+hash and a dict lookup. The remote check is only used when the signing key
+can't be resolved locally.
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+import jwt
+
+
+class UnknownSigningKey(Exception):
+    """The token's key isn't available locally (no secret configured, kid not in the JWKS)."""
+
+
+def _unverified_expiry(token: str) -> float:
+    """The token's exp claim, read without verification (the remote check vouched for it)."""
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return 0.0
+    return float(exp) if isinstance(exp, (int, float)) else 0.0
+
+
+class JWTVerifier:
+
+    def __init__(self, secret: str | None = None, jwks_url: str | None = None, audience: str = "authenticated",
+                 ttl: float = 60.0, max_entries: int = 10000, fallback: Callable[[str], Awaitable[dict | None]] | None = None,
+                 jwks_lifespan: float = 600.0, jwks_cooldown: float = 30.0):
+        self.secret = secret
+        self.audience = audience
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.fallback = fallback
+        # The key set is refetched once it's jwks_lifespan old, or when a token names
+        # an unknown kid, at most once per jwks_cooldown (kids are attacker-chosen)
+        self.jwks_lifespan = jwks_lifespan
+        self.jwks_cooldown = jwks_cooldown
+        self._jwks = jwt.PyJWKClient(jwks_url, cache_jwk_set=False, timeout=5) if jwks_url else None
+        self._keys: dict[str, object] = {}
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._jwks_lock = threading.Lock()
+        self._verified: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def verify(self, token: str) -> dict | None:
+        """User info ({"id", "email"}) for a valid token, None otherwise."""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            entry = self._verified.get(key)
+            if entry is not None and entry[0] > now:
+                self._verified.move_to_end(key)
+                return entry[1]
+
+        try:
+            claims = await self.decode(token)
+        except UnknownSigningKey:
+            user = await self.fallback(token) if self.fallback else None
+            expires = min(now + self.ttl, _unverified_expiry(token))
+        except jwt.PyJWTError:
+            return None
+        else:
+            user = {"id": claims["sub"], "email": claims.get("email")}
+            # Never trust a cached token past its own expiry
+            expires = min(now + self.ttl, claims["exp"])
+
+        if user is not None and expires > now:
+            with self._lock:
+                self._verified[key] = (expires, user)
+                self._verified.move_to_end(key)
+                while len(self._verified) > self.max_entries:
+                    self._verified.popitem(last=False)
+        return user
+
+    async def decode(self, token: str) -> dict:
+        """Verified claims; raises UnknownSigningKey or a PyJWTError."""
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg")
+        if algorithm == "HS256":
+            if not self.secret:
+                raise UnknownSigningKey("no JWT secret configured")
+            key = self.secret
+        elif algorithm in ("RS256", "ES256"):
+            if self._jwks is None:
+                raise UnknownSigningKey("no JWKS configured")
+            key = await self._signing_key(header.get("kid"))
+        else:
+            raise jwt.InvalidAlgorithmError(f"Unsupported algorithm: {algorithm}")
+        return jwt.decode(token, key, algorithms=[algorithm], audience=self.audience, options={"require": ["exp", "sub"]})
+
+    async def _signing_key(self, kid: str | None):
+        """Public key for `kid`: inline from the cached key set, fetching it first when needed."""
+        now = time.monotonic()
+        key = self._keys.get(kid)
+        fresh = self._fetched_at is not None and now - self._fetched_at < self.jwks_lifespan
+        if key is not None and fresh:
+            return key
+        cooling_down = self._attempted_at is not None and now - self._attempted_at < self.jwks_cooldown
+        if not cooling_down:
+            try:
+                await asyncio.to_thread(self._refresh_keys, self._attempted_at)
+            except (jwt.PyJWKClientError, jwt.PyJWKError) as e:
+                if key is None:
+                    raise UnknownSigningKey(str(e))
+                # Keep using a known key while the JWKS endpoint is unreachable
+        key = self._keys.get(kid)
+        if key is None:
+            raise UnknownSigningKey(f"kid {kid!r} not in the JWKS")
+        return key
+
+    def _refresh_keys(self, attempted_at: float | None):
+        with self._jwks_lock:
+            if self._attempted_at != attempted_at:
+                return  # another request refreshed while this one waited
+            self._attempted_at = time.monotonic()
+            keys = self._jwks.get_signing_keys()
+            self._keys = {jwk.key_id: jwk.key for jwk in keys}
+            self._fetched_at = time.monotonic()
@@ -0,0 +1,108 @@
+"""
+Keyword matching against job descriptions.
+
+Text is split into tokens once and keywords are matched as token sequences, so
+the cost per job description is one tokenizer pass plus a lookup per keyword.
+A keyword also matches any other name in its ALIASES group. Names that are also
+everyday words (CASE_SENSITIVE) only match when written the same way.
+"""
+import re
+from collections import Counter
+from functools import lru_cache
+
+# Word runs with an optional leading "." (".NET") and trailing "+"/"#" ("C++", "C#").
+# "C" therefore never matches inside "C++" or "C#", and "Java" not inside "JavaScript".
+_TOKEN = re.compile(r"\.?\w[\w+#]*")
+
+# Names that refer to the same skill. Occurrences of every name in a group are
+# summed, so no name may be a token subsequence of another in the same group.
+ALIASES = (
+    ("PostgreSQL", "Postgres", "psql"),
+    ("Kubernetes", "k8s"),
+    ("JavaScript", "JS", "ECMAScript"),
+    ("TypeScript", "TS"),
+    ("Node.js", "NodeJS"),
+    ("React", "ReactJS"),
+    ("Vue", "VueJS"),
+    ("Next.js", "NextJS"),
+    ("Go", "Golang"),
+    ("C++", "CPP"),
+    ("C#", "CSharp"),
+    ("Objective-C", "ObjC"),
+    ("MongoDB", "Mongo"),
+    ("SQL Server", "MSSQL"),
+    ("Amazon Web Services", "AWS"),
+    ("Google Cloud Platform", "GCP"),
+    ("Scikit-learn", "sklearn"),
+    ("PyTorch", "Torch"),
+    ("Machine Learning", "ML"),
+    ("Natural Language Processing", "NLP"),
+    ("CI/CD", "Continuous Integration"),
+)
+
+# Single-token names that are also common English words ("rest", "go")
+CASE_SENSITIVE = ("REST", "Go")
+
+
+def tokenize(text: str) -> tuple[str, ...]:
+    return tuple(token.lower() for token in _TOKEN.findall(text))
+
+
+_CASED = {name.lower(): name for name in CASE_SENSITIVE}
+
+
+def _variant(name: str) -> tuple[tuple[str, ...], bool]:
+    """(tokens, cased): cased variants are matched against the text's original-case tokens."""
+    pattern = tokenize(name)
+    if len(pattern) == 1 and pattern[0] in _CASED:
+        return (_CASED[pattern[0]],), True
+    return pattern, False
+
+
+_ALIAS_GROUPS = {}
+for _names in ALIASES:
+    _group = tuple(_variant(name) for name in _names)
+    _ALIAS_GROUPS.update(dict.fromkeys((tokenize(name) for name in _names), _group))
+
+
+def _variants(keyword: str) -> tuple[tuple[tuple[str, ...], bool], ...]:
+    pattern = tokenize(keyword)
+    if not pattern:
+        return ()
+    return _ALIAS_GROUPS.get(pattern, (_variant(keyword),))
+
+
+@lru_cache(maxsize=64)
+def _ngram_counts(text: str, max_n: int) -> Counter:
+    tokens = tokenize(text)
+    counts = Counter()
+    for n in range(1, max_n + 1):
+        counts.update(zip(*(tokens[i:] for i in range(n))))
+    return counts
+
+
+@lru_cache(maxsize=64)
+def _cased_counts(text: str) -> Counter:
+    return Counter((token,) for token in _TOKEN.findall(text))
+
+
+class KeywordMatcher:
+    """Counts occurrences of a fixed keyword list (and aliases) in any number of texts."""
+
+    def __init__(self, keywords: tuple[str, ...]):
+        self.keywords = keywords
+        self._patterns = [_variants(keyword) for keyword in keywords]
+        self._max_n = max((len(tokens) for variants in self._patterns for tokens, _ in variants), default=0)
+        self._any_cased = any(cased for variants in self._patterns for _, cased in variants)
+
+    def counts(self, text: str) -> list[int]:
+        if not self._max_n:
+            return [0] * len(self._patterns)
+        ngrams = (_ngram_counts(text, self._max_n), _cased_counts(text) if self._any_cased else None)
+        return [sum(ngrams[cased][tokens] for tokens, cased in variants) for variants in self._patterns]
+
+
+@lru_cache(maxsize=256)
+def keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    """Shared matcher per keyword list; a resume's skills rarely change between requests."""
+    return KeywordMatcher(keywords)
@@ -0,0 +1,130 @@
+"""
+LaTeX templates compiled once into static chunks and placeholder slots.
+"""
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+
+_PLACEHOLDER = re.compile(r"\{\{([A-Z_]+)\}\}")
+
+_LATEX_SPECIAL = re.compile(r"[\\&%$#_{}~^]")
+_LATEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+}
+
+
+def _escape_match(match: re.Match) -> str:
+    return _LATEX_ESCAPES[match.group()]
+
+
+@lru_cache(maxsize=8192)
+def _escape_special(text: str) -> str:
+    # One pass, so the braces of \textbackslash{} are never escaped again
+    return _LATEX_SPECIAL.sub(_escape_match, text)
+
+
+def escape_latex(text: str) -> str:
+    # Most fields have nothing to escape: one scan and the string is returned as-is
+    if not text or not _LATEX_SPECIAL.search(text):
+        return text or ""
+    # Bullets are re-rendered on every export; escape each distinct string once
+    return _escape_special(text)
+
+
+class CompiledTemplate:
+    """A template split into static chunks around its `{{NAME}}` placeholders."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.chunks: list[str] = []
+        self.slots: list[str] = []
+        start = 0
+        for match in _PLACEHOLDER.finditer(source):
+            self.chunks.append(source[start:match.start()])
+            self.slots.append(match.group(1))
+            start = match.end()
+        self.chunks.append(source[start:])
+
+    def render(self, values: dict[str, str]) -> str:
+        parts = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            # Unknown placeholders are left in place, as before
+            parts.append(values.get(slot, f"{{{{{slot}}}}}"))
+            parts.append(chunk)
+        return "".join(parts)
+
+
+_compiled: dict[str, tuple[int, CompiledTemplate]] = {}
+_compiled_lock = threading.Lock()
+
+
+def load_template(template_path: str) -> CompiledTemplate:
+    """Compiled template for a path, recompiled only when the file's mtime changes."""
+    mtime = os.stat(template_path).st_mtime_ns
+    cached = _compiled.get(template_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(template_path, 'r') as f:
+        template = CompiledTemplate(f.read())
+    with _compiled_lock:
+        _compiled[template_path] = (mtime, template)
+    return template
+
+
+class TemplateRegistry:
+    """
+    Compiled `<name>_template.tex` files in a directory, keyed by name. The
+    directory is rescanned at most every `rescan_interval` seconds; only files
+    whose mtime changed are re-read, and new templates appear without a restart.
+    """
+
+    SUFFIX = "_template.tex"
+
+    def __init__(self, directory: str, rescan_interval: float = 2.0):
+        self.directory = directory
+        self.rescan_interval = rescan_interval
+        self._templates: dict[str, tuple[int, CompiledTemplate]] = {}
+        self._last_scan = float("-inf")
+        self._lock = threading.Lock()
+
+    def names(self) -> list[str]:
+        self._refresh()
+        return sorted(self._templates)
+
+    def get(self, name: str) -> CompiledTemplate | None:
+        self._refresh()
+        entry = self._templates.get(name)
+        return entry[1] if entry is not None else None
+
+    def _refresh(self):
+        if time.monotonic() - self._last_scan < self.rescan_interval:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_scan < self.rescan_interval:
+                return
+            templates = {}
+            for entry in os.scandir(self.directory):
+                if not entry.is_file() or not entry.name.endswith(self.SUFFIX):
+                    continue
+                name = entry.name[:-len(self.SUFFIX)]
+                mtime = entry.stat().st_mtime_ns
+                cached = self._templates.get(name)
+                if cached is not None and cached[0] == mtime:
+                    templates[name] = cached
+                else:
+                    with open(entry.path, 'r') as f:
+                        templates[name] = (mtime, CompiledTemplate(f.read()))
+            self._templates = templates
+            self._last_scan = time.monotonic()
@@ -1,4 +1,19 @@
+# Models are slotted: a resume is rebuilt from JSON on every request and batch
+# tailoring makes one copy per (resume, job description) pair.
+
+METRIC_FIELDS = ("similarity", "impressiveness", "score")
+
+
+def _drop_null_metrics(data: dict) -> dict:
+    for key in METRIC_FIELDS:
+        if key in data and data[key] is None:
+            del data[key]
+    return data
+
+
 class Resume:
+    __slots__ = ("full_name", "contacts", "education", "experience", "projects", "techs", "languages")
+
     def __init__(self, resume: dict):
         self.full_name = resume.get("full_name")
         self.contacts = resume.get("contacts", {})
@@ -8,6 +23,18 @@ class Resume:
         self.techs = [Tech(item) for item in resume["technologies"]]
         self.languages = [Language(item) for item in resume["languages"]]
 
+    def copy(self) -> "Resume":
+        """Deep copy of everything tailoring mutates (sections, bullets, keywords)."""
+        clone = Resume.__new__(Resume)
+        clone.full_name = self.full_name
+        clone.contacts = dict(self.contacts)
+        clone.education = [item.copy() for item in self.education]
+        clone.experience = [item.copy() for item in self.experience]
+        clone.projects = [item.copy() for item in self.projects]
+        clone.techs = [item.copy() for item in self.techs]
+        clone.languages = [item.copy() for item in self.languages]
+        return clone
+
     def all_bullets(self) -> list["Bullet"]:
         exp_bullets = [bullet for exp in self.experience for bullet in exp.bullets]
         proj_bullets = [bullet for project in self.projects for bullet in project.bullets]
@@ -114,19 +141,21 @@ class Resume:
             sections.append("Languages\n" + ", ".join(language_items))
         return "\n\n".join(sections)
 
-    def to_dict(self) -> dict:
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
         return {
             "full_name": self.full_name,
             "contacts": self.contacts,
             "education": [item.to_dict() for item in self.education],
-            "experience": [item.to_dict() for item in self.experience],
-            "projects": [item.to_dict() for item in self.projects],
-            "technologies": [item.to_dict() for item in self.techs],
-            "languages": [item.to_dict() for item in self.languages],
+            "experience": [item.to_dict(omit_null_metrics) for item in self.experience],
+            "projects": [item.to_dict(omit_null_metrics) for item in self.projects],
+            "technologies": [item.to_dict(omit_null_metrics) for item in self.techs],
+            "languages": [item.to_dict(omit_null_metrics) for item in self.languages],
         }
 
 
 class Education:
+    __slots__ = ("est_name", "location", "degree", "gpa", "year")
+
     def __init__(self, education: dict):
         self.est_name = education.get("est_name")
         self.location = education.get("location")
@@ -134,6 +163,15 @@ class Education:
         self.gpa = education.get("gpa")
         self.year = education.get("year")
 
+    def copy(self) -> "Education":
+        clone = Education.__new__(Education)
+        clone.est_name = self.est_name
+        clone.location = self.location
+        clone.degree = self.degree
+        clone.gpa = self.gpa
+        clone.year = self.year
+        return clone
+
     def to_dict(self) -> dict:
         return {
             "est_name": self.est_name,
@@ -145,6 +183,8 @@ class Education:
 
 
 class Experience:
+    __slots__ = ("employer", "title", "location", "duration", "bullets", "similarity", "impressiveness", "score")
+
     def __init__(self, experience: dict):
         self.employer = experience["employer"]
         self.title = experience["title"]
@@ -155,6 +195,18 @@ class Experience:
         self.impressiveness = experience.get("impressiveness")
         self.score = experience.get("score")
 
+    def copy(self) -> "Experience":
+        clone = Experience.__new__(Experience)
+        clone.employer = self.employer
+        clone.title = self.title
+        clone.location = self.location
+        clone.duration = self.duration
+        clone.bullets = [bullet.copy() for bullet in self.bullets]
+        clone.similarity = self.similarity
+        clone.impressiveness = self.impressiveness
+        clone.score = self.score
+        return clone
+
     def calculate_score(self, sim_weight: float, imp_weight: float) -> float:
         sim = self.similarity if self.similarity is not None else 0.5
         imp = self.impressiveness if self.impressiveness is not None else 0.5
@@ -175,20 +227,23 @@ class Experience:
     def sort_bullets_by_score(self):
         self.bullets.sort(key=lambda b: b.score if b.score is not None else 0, reverse=True)
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
+        data = {
             "employer": self.employer,
             "title": self.title,
             "location": self.location,
             "duration": self.duration,
-            "bullets": [bullet.to_dict() for bullet in self.bullets],
+            "bullets": [bullet.to_dict(omit_null_metrics) for bullet in self.bullets],
             "similarity": self.similarity,
             "impressiveness": self.impressiveness,
             "score": self.score,
         }
+        return _drop_null_metrics(data) if omit_null_metrics else data
 
 
 class Project:
+    __slots__ = ("title", "languages", "bullets", "similarity", "impressiveness", "score")
+
     def __init__(self, project: dict):
         self.title = project["title"]
         self.languages = project["languages"]
@@ -197,6 +252,16 @@ class Project:
         self.impressiveness = project.get("impressiveness")
         self.score = project.get("score")
 
+    def copy(self) -> "Project":
+        clone = Project.__new__(Project)
+        clone.title = self.title
+        clone.languages = self.languages
+        clone.bullets = [bullet.copy() for bullet in self.bullets]
+        clone.similarity = self.similarity
+        clone.impressiveness = self.impressiveness
+        clone.score = self.score
+        return clone
+
     def calculate_score(self, sim_weight: float, imp_weight: float) -> float:
         sim = self.similarity if self.similarity is not None else 0.5
         imp = self.impressiveness if self.impressiveness is not None else 0.5
@@ -217,57 +282,87 @@ class Project:
     def sort_bullets_by_score(self):
         self.bullets.sort(key=lambda b: b.score if b.score is not None else 0, reverse=True)
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
+        data = {
             "title": self.title,
             "languages": self.languages,
-            "bullets": [bullet.to_dict() for bullet in self.bullets],
+            "bullets": [bullet.to_dict(omit_null_metrics) for bullet in self.bullets],
             "similarity": self.similarity,
             "impressiveness": self.impressiveness,
             "score": self.score,
         }
+        return _drop_null_metrics(data) if omit_null_metrics else data
 
 
 class Tech:
+    __slots__ = ("text", "score")
+
     def __init__(self, tech: dict):
         self.text = tech.get("text")
         self.score = tech.get("score")
 
-    def to_dict(self) -> dict:
-        return {
+    def copy(self) -> "Tech":
+        clone = Tech.__new__(Tech)
+        clone.text = self.text
+        clone.score = self.score
+        return clone
+
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
+        data = {
             "text": self.text,
             "score": self.score,
         }
+        return _drop_null_metrics(data) if omit_null_metrics else data
 
 
 class Language:
+    __slots__ = ("text", "score")
+
     def __init__(self, language: dict):
         self.text = language.get("text")
         self.score = language.get("score")
 
-    def to_dict(self) -> dict:
-        return {
+    def copy(self) -> "Language":
+        clone = Language.__new__(Language)
+        clone.text = self.text
+        clone.score = self.score
+        return clone
+
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
+        data = {
             "text": self.text,
             "score": self.score,
         }
+        return _drop_null_metrics(data) if omit_null_metrics else data
 
 
 class Bullet:
+    __slots__ = ("text", "impressiveness", "similarity", "score")
+
     def __init__(self, bullet: dict):
         self.text = bullet.get("text")
         self.impressiveness = bullet.get("impressiveness")
         self.similarity = bullet.get("similarity")
         self.score = bullet.get("score")
 
+    def copy(self) -> "Bullet":
+        clone = Bullet.__new__(Bullet)
+        clone.text = self.text
+        clone.impressiveness = self.impressiveness
+        clone.similarity = self.similarity
+        clone.score = self.score
+        return clone
+
     def calculate_score(self, sim_weight: float, imp_weight: float) -> float:
         sim = self.similarity if self.similarity is not None else 0.5
         imp = self.impressiveness if self.impressiveness is not None else 0.5
         return sim * sim_weight + imp * imp_weight
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, omit_null_metrics: bool = False) -> dict:
+        data = {
             "text": self.text,
             "impressiveness": self.impressiveness,
             "similarity": self.similarity,
             "score": self.score,
         }
+        return _drop_null_metrics(data) if omit_null_metrics else data
@@ -0,0 +1,112 @@
+"""
+One-page fitting: estimate each entry's rendered height from per-template
+metrics and keep the highest-scoring bullets and sections that fit on a page.
+"""
+import math
+
+import numpy as np
+
+from models import Resume
+
+
+class PageMetrics:
+    """
+    Approximate layout of a template, in points. Bullets take
+    ceil(len(text) / chars_per_line) lines of line_height plus bullet_gap.
+    """
+
+    __slots__ = (
+        "page_height", "header", "section_title", "education_entry", "experience_heading",
+        "project_heading", "chars_per_line", "line_height", "bullet_gap", "slack",
+    )
+
+    def __init__(self, page_height: float, header: float, section_title: float, education_entry: float, experience_heading: float,
+                 project_heading: float, chars_per_line: int, line_height: float, bullet_gap: float, slack: float = 0.03):
+        self.page_height = page_height
+        self.header = header
+        self.section_title = section_title
+        self.education_entry = education_entry
+        self.experience_heading = experience_heading
+        self.project_heading = project_heading
+        self.chars_per_line = chars_per_line
+        self.line_height = line_height
+        self.bullet_gap = bullet_gap
+        self.slack = slack  # share of the page held back for estimation error
+
+    def lines(self, text: str) -> int:
+        return max(1, math.ceil(len(text) / self.chars_per_line))
+
+    def bullet_height(self, text: str) -> float:
+        return self.lines(text) * self.line_height + self.bullet_gap
+
+
+# Letter paper, 11pt documents with \small (10pt on 12pt) bullets. jake:
+# Computer Modern, 507pt bullet lines (7.5in text, 0.15in + \leftmarginii
+# indent); mirage: Times, 525.5pt lines (7.5in text, 1.5em indent).
+# chars_per_line comes from `benchmarks/calibrate_page_fit.py widths` with the
+# fonts' AFM metrics (cmr10, ptmr8a): the largest value that never undercounts
+# wrapped lines over the sample bullets and job descriptions. Vertical metrics
+# follow the templates' lengths; `calibrate_page_fit.py heights` measures them
+# with pdflatex.
+PAGE_METRICS = {
+    "jake": PageMetrics(page_height=720, header=46, section_title=22, education_entry=26, experience_heading=26,
+                        project_heading=14, chars_per_line=108, line_height=12, bullet_gap=2),
+    "mirage": PageMetrics(page_height=720, header=45, section_title=37, education_entry=30, experience_heading=30,
+                          project_heading=17, chars_per_line=124, line_height=12, bullet_gap=2),
+}
+
+
+def page_metrics(template_name: str) -> PageMetrics:
+    """Metrics for a template; templates without their own use jake's."""
+    return PAGE_METRICS.get(template_name, PAGE_METRICS["jake"])
+
+
+def fit_to_page(resume: Resume, metrics: PageMetrics) -> Resume:
+    """
+    Trim a tailored resume (sections and bullets already in score order) so its
+    estimated height fits one page, maximizing the total score of kept bullets.
+    Each section keeps a prefix of its bullets; projects may also be dropped,
+    experiences keep at least one bullet. This is a multiple-choice knapsack
+    solved by DP over whole points of height. Education, skills and sections
+    without bullets are always kept. If even that can't fit, every experience
+    keeps its best bullet and projects are dropped.
+    """
+    sections = [(section, metrics.experience_heading, True) for section in resume.experience]
+    sections += [(section, metrics.project_heading, False) for section in resume.projects]
+    scored = [(section, heading, required) for section, heading, required in sections if section.bullets]
+
+    fixed = metrics.header + 4 * metrics.section_title + len(resume.education) * metrics.education_entry
+    fixed += sum(heading for section, heading, _ in sections if not section.bullets)
+    for label, items in (("Languages: ", resume.languages), ("Technologies: ", resume.techs)):
+        fixed += metrics.lines(label + ", ".join(item.text or "" for item in items)) * metrics.line_height
+    budget = max(0, math.floor(metrics.page_height * (1 - metrics.slack) - fixed))
+
+    # best[c]: highest total score with at most c points used by the sections so far
+    best = np.zeros(budget + 1)
+    choices = []
+    for section, heading, required in scored:
+        # Option k keeps the top k bullets; option 0 drops the section
+        heights = [0] + np.ceil(np.cumsum([metrics.bullet_height(bullet.text or "") for bullet in section.bullets]) + heading).astype(int).tolist()
+        values = np.cumsum([bullet.score or 0.0 for bullet in section.bullets]).tolist()
+        options = np.full((len(heights), budget + 1), -np.inf)
+        if not required:
+            options[0] = best
+        for k in range(1, len(heights)):
+            if heights[k] <= budget:
+                options[k, heights[k]:] = best[:budget + 1 - heights[k]] + values[k - 1]
+        choice = np.argmax(options, axis=0)
+        best = options[choice, np.arange(budget + 1)]
+        choices.append((choice, heights))
+
+    kept = {}
+    capacity = budget
+    for (section, _, required), (choice, heights) in zip(reversed(scored), reversed(choices)):
+        k = int(choice[capacity]) if best[budget] > -np.inf else int(required)
+        kept[id(section)] = k
+        capacity -= heights[k]
+
+    for section, _, _ in scored:
+        section.bullets = section.bullets[:kept[id(section)]]
+    resume.experience = [section for section in resume.experience if section.bullets or id(section) not in kept]
+    resume.projects = [section for section in resume.projects if section.bullets or id(section) not in kept]
+    return resume
@@ -1,39 +1,207 @@
-from sentence_transformers import SentenceTransformer
+import hashlib
+import os
+import re
+
+import numpy as np
+
+from embedding_cache import EmbeddingCache, make_key
+from scheduler import EmbeddingScheduler
+
+
+def _env_int(name: str, default: int | None = None) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _normalize_target(text: str) -> str:
+    # Whitespace-only differences (pasted postings, trailing newlines) share an embedding
+    return " ".join(text.split())
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+_LIST_MARKER = re.compile(r"^(?:[-*\u2022\u00b7\u25aa]|\d+[.)])\s*")
+
+
+def chunk_text(text: str, max_chars: int, max_chunks: int | None = None) -> list[str]:
+    """
+    Split a job description into sentence/requirement chunks of at most
+    `max_chars` characters. Postings are line-oriented, so lines and sentences
+    are the split points; short neighbours are packed together to keep context,
+    and anything still too long is cut at word boundaries. Text past the first
+    `max_chunks` chunks is dropped, so encoding cost is bounded for any length.
+    """
+    pieces = []
+    for line in text.splitlines():
+        for sentence in _SENTENCE_END.split(_LIST_MARKER.sub("", line.strip())):
+            words = sentence.split()
+            while words:
+                piece, words = _take_words(words, max_chars)
+                pieces.append(piece)
+
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + 1 + len(piece) <= max_chars:
+            chunks[-1] += " " + piece
+        elif max_chunks is not None and len(chunks) >= max_chunks:
+            break
+        else:
+            chunks.append(piece)
+    return chunks or [_normalize_target(text)]
+
+
+def _take_words(words: list[str], max_chars: int) -> tuple[str, list[str]]:
+    length = len(words[0])
+    count = 1
+    while count < len(words) and length + 1 + len(words[count]) <= max_chars:
+        length += 1 + len(words[count])
+        count += 1
+    return " ".join(words[:count]), words[count:]
+
+
+def _load_model(model_name: str, backend: str):
+    # Deferred so importing the API doesn't pull in torch
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "onnx":
+        # Needs optimum[onnxruntime]; exports the model on first load if the repo has no ONNX file
+        return SentenceTransformer(model_name, backend="onnx")
+
+    model = SentenceTransformer(model_name)
+    if backend == "int8":
+        import torch
+        # Dynamic quantization: int8 weights for every Linear layer, activations quantized on the fly (CPU only)
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
 
 
 class Relevance():
-    def __init__(self, model_name="Qwen/Qwen3-Embedding-0.6B"):
+    BACKENDS = ("torch", "onnx", "int8")
+    # How job descriptions are compared: whole text ("off"), or chunked and scored
+    # against the normalized mean of chunk embeddings ("mean") or the best chunk ("max")
+    CHUNK_POOLING = ("off", "mean", "max")
+
+    def __init__(self, model_name="Qwen/Qwen3-Embedding-0.6B", cache_dir: str | None = None, cache_max_entries: int | None = None, cache_max_bytes: int | None = None, backend: str | None = None, embedding_dim: int | None = None, dtype: str | None = None, chunk_pooling: str | None = None, chunk_chars: int | None = None, max_chunks: int | None = None):
+        backend = backend or os.getenv("EMBEDDING_BACKEND", "torch")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown embedding backend '{backend}', expected one of {', '.join(self.BACKENDS)}")
+        chunk_pooling = chunk_pooling or os.getenv("JD_CHUNK_POOLING", "mean")
+        if chunk_pooling not in self.CHUNK_POOLING:
+            raise ValueError(f"Unknown JD chunk pooling '{chunk_pooling}', expected one of {', '.join(self.CHUNK_POOLING)}")
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = _load_model(model_name, backend)
         except Exception as e:
-            raise RuntimeError(f"Failed to load embedding model '{model_name}': {e}")
-        self._embedding_cache = {}
+            raise RuntimeError(f"Failed to load embedding model '{model_name}' ({backend}): {e}")
+        self.backend = backend
+        self.chunk_pooling = chunk_pooling
+        # Bounded chunks keep every sequence short, and at most max_chunks of them
+        # are encoded, so JD encoding cost is capped however long the posting is
+        self.chunk_chars = chunk_chars or _env_int("JD_CHUNK_CHARS", 400)
+        self.max_chunks = max_chunks or _env_int("JD_MAX_CHUNKS", 24)
+        # Qwen3-Embedding is Matryoshka-trained: a prefix of the vector is itself a usable embedding
+        self.embedding_dim = embedding_dim or _env_int("EMBEDDING_DIM")
+        self.dtype = np.dtype(dtype or os.getenv("EMBEDDING_DTYPE", "float16"))
+        # Backends and widths produce different vectors, so they never share cache entries
+        self.model_name = model_name if backend == "torch" else f"{model_name}@{backend}"
+        if self.embedding_dim:
+            self.model_name += f"/{self.embedding_dim}"
+
+        cache_dir = cache_dir if cache_dir is not None else os.getenv("EMBEDDING_CACHE_DIR", "../data/cache/embeddings")
+        if cache_dir:
+            # One store per model and storage type so vectors of different widths never share a file
+            store_id = f"{self.model_name}:{self.dtype.name}"
+            cache_dir = os.path.join(cache_dir, hashlib.sha256(store_id.encode("utf-8")).hexdigest()[:16])
+        self._embedding_cache = EmbeddingCache(
+            path=cache_dir or None,
+            dtype=self.dtype.name,
+            max_entries=cache_max_entries if cache_max_entries is not None else _env_int("EMBEDDING_CACHE_MAX_ENTRIES", 10000),
+            max_bytes=cache_max_bytes if cache_max_bytes is not None else _env_int("EMBEDDING_CACHE_MAX_BYTES"),
+        )
+        # Job descriptions (or their chunks) get their own LRU so a burst of resume
+        # bullets can't evict the posting being tailored against
+        self._target_cache = EmbeddingCache(max_entries=_env_int("JD_CACHE_MAX_ENTRIES", 4096), dtype=self.dtype.name)
+
+        # Concurrent /tailor requests share model calls instead of competing for cores
+        self._scheduler = EmbeddingScheduler(
+            self._encode,
+            max_batch_size=_env_int("EMBED_MAX_BATCH_SIZE", 64),
+            max_wait=_env_int("EMBED_MAX_WAIT_MS", 5) / 1000,
+        )
 
-    def _get_embeddings(self, strings: list[str]) -> list:
+    def cache_stats(self) -> dict:
+        return {
+            "bullets": self._embedding_cache.stats(),
+            "job_descriptions": self._target_cache.stats(),
+        }
+
+    def _encode(self, texts: list[str], prompt_name: str | None) -> np.ndarray:
+        """Encode, truncate to embedding_dim and L2-normalize, so cosine similarity is a dot product."""
+        embeddings = np.asarray(self.model.encode(texts, prompt_name=prompt_name), dtype=np.float32)
+        if self.embedding_dim:
+            embeddings = embeddings[:, :self.embedding_dim]
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return (embeddings / np.maximum(norms, 1e-12)).astype(self.dtype)
+
+    def _get_embeddings(self, strings: list[str], prompt_name: str | None = "query", cache: EmbeddingCache | None = None) -> np.ndarray:
         if not strings:
-            return []
-        
-        to_embed = [s for s in strings if s not in self._embedding_cache]
+            return np.empty((0, 0), dtype=np.float32)
+        cache = cache if cache is not None else self._embedding_cache
+
+        keys = [make_key(self.model_name, prompt_name, s) for s in strings]
+        cached = cache.get_many(keys)
+
+        to_embed = {}
+        for key, s in zip(keys, strings):
+            if key not in cached:
+                to_embed.setdefault(key, s)
 
         if to_embed:
-            new_embeddings = self.model.encode(to_embed, prompt_name="query")
-            for s, emb in zip(to_embed, new_embeddings):
-                self._embedding_cache[s] = emb
-        
-        return [self._embedding_cache[s] for s in strings]
+            new_embeddings = self._scheduler.encode(list(to_embed.values()), prompt_name)
+            new_items = dict(zip(to_embed.keys(), new_embeddings))
+            cache.put_many(new_items)
+            cached.update(new_items)
+
+        return np.stack([cached[key] for key in keys])
+
+    def _get_target_embeddings(self, targets: list[str]) -> np.ndarray:
+        return self._get_embeddings([_normalize_target(t) for t in targets], prompt_name=None, cache=self._target_cache)
+
+    def _target_similarities(self, query_embeddings: np.ndarray, targets: list[str]) -> np.ndarray:
+        """Raw cosine similarity of each query against each target, per chunk_pooling."""
+        if self.chunk_pooling == "off":
+            return query_embeddings @ self._get_target_embeddings(targets).astype(np.float32).T
+
+        # Chunks of every target go to the model as one batch; starts[j] is target j's first chunk
+        chunked = [chunk_text(target, self.chunk_chars, self.max_chunks) for target in targets]
+        starts = np.cumsum([0] + [len(chunks) for chunks in chunked[:-1]])
+        chunks = [chunk for target_chunks in chunked for chunk in target_chunks]
+        chunk_embeddings = self._get_embeddings(chunks, prompt_name=None, cache=self._target_cache).astype(np.float32)
+
+        if self.chunk_pooling == "max":
+            return np.maximum.reduceat(query_embeddings @ chunk_embeddings.T, starts, axis=1)
+        pooled = np.add.reduceat(chunk_embeddings, starts, axis=0)
+        pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return query_embeddings @ pooled.T
 
     def calculate_similarities(self, strings: list[str], target: str) -> list[float]:
         if not strings:
             return []
-        if not target:
-            return [0.5] * len(strings)  # Neutral scores if no job description
-        
-        query_embeddings = self._get_embeddings(strings)
-        document_embeddings = self.model.encode([target])
-
-        # Compute the (cosine) similarity between the query and document embeddings
-        similarities = self.model.similarity(query_embeddings, document_embeddings) # each in [-1, 1]
+        return self.similarity_matrix(strings, [target])[:, 0].tolist()
+
+    def similarity_matrix(self, strings: list[str], targets: list[str]) -> np.ndarray:
+        """
+        Normalized similarity of every string against every target, shape
+        (len(strings), len(targets)). Each side is encoded once, in one batch.
+        """
+        similarities = np.full((len(strings), len(targets)), 0.5)  # Neutral scores if no job description
+        present = [j for j, target in enumerate(targets) if target]
+        if not strings or not present:
+            return similarities
+
+        # Cosine similarity of unit vectors; float16 is widened first since NumPy has no fast half matmul
+        query_embeddings = self._get_embeddings(strings).astype(np.float32)
+        raw = self._target_similarities(query_embeddings, [targets[j] for j in present])
+        raw = np.clip(raw, -1.0, 1.0) # each in [-1, 1]
         # Normalize similarities
-        normalized_sims = [(float(sim) + 1) / 2 for sim in similarities] # each in [0, 1]
+        similarities[:, present] = (raw + 1) / 2 # each in [0, 1]
 
-        return normalized_sims
+        return similarities
@@ -0,0 +1,105 @@
+"""
+Content-addressed on-disk cache for rendered PDF/LaTeX exports.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from models import METRIC_FIELDS
+
+
+def _strip_metrics(value):
+    # Tailoring metrics never reach the rendered document
+    if isinstance(value, dict):
+        return {k: _strip_metrics(v) for k, v in value.items() if k not in METRIC_FIELDS}
+    if isinstance(value, list):
+        return [_strip_metrics(v) for v in value]
+    return value
+
+
+def render_key(template_content: str, resume: dict, output_type: str) -> str:
+    """Hash of everything that determines the rendered bytes."""
+    digest = hashlib.sha256()
+    digest.update(output_type.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(template_content.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(json.dumps(_strip_metrics(resume), sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Stores one file per key under `path`. Reads refresh the file's mtime so
+    eviction (oldest mtime first) approximates LRU once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._bytes = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> bytes | None:
+        file_path = os.path.join(self.path, key)
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            os.utime(file_path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        # Write-then-rename so concurrent readers (and workers) never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        file_path = os.path.join(self.path, key)
+        with self._lock:
+            # Overwriting a key replaces its bytes rather than adding to them
+            try:
+                replaced = os.path.getsize(file_path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, file_path)
+            self._bytes += len(data) - replaced
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else None,
+        }
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and not entry.name.startswith(".tmp-"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        # Recount from disk: other workers share the directory
+        self._bytes = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, file_path in entries:
+            if self._bytes <= target:
+                break
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            self._bytes -= size
@@ -0,0 +1,218 @@
+"""
+Bounded pool of asyncio pdflatex subprocesses for PDF export.
+"""
+import asyncio
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
+import threading
+
+# pdflatex only needs another pass when the log asks for one (labels, refs, TOC)
+MAX_PASSES = 3
+_RERUN_PATTERN = re.compile(rb"Rerun to get|Label\(s\) may have changed|please rerun|Rerun LaTeX", re.IGNORECASE)
+
+# Templates mark where the dumpable preamble ends; a no-op without a format
+END_OF_DUMP = "\\csname endofdump\\endcsname"
+BEGIN_DOCUMENT = "\\begin{document}"
+
+
+class RenderQueueFull(RuntimeError):
+    pass
+
+
+class RenderTimeout(RuntimeError):
+    pass
+
+
+def pdflatex_command(output_dir: str, tex_file: str, fmt: str | None = None) -> list[str]:
+    command = ["pdflatex", "-interaction=nonstopmode", "-output-directory", output_dir, tex_file]
+    if fmt:
+        command.insert(1, f"-fmt={fmt}")
+    return command
+
+
+def needs_rerun(log_file: str) -> bool:
+    try:
+        with open(log_file, "rb") as f:
+            return _RERUN_PATTERN.search(f.read()) is not None
+    except FileNotFoundError:
+        return False
+
+
+def _dumped_preamble(latex: str) -> str | None:
+    marker = latex.find(END_OF_DUMP)
+    if marker != -1:
+        return latex[:marker + len(END_OF_DUMP)]
+    begin = latex.find(BEGIN_DOCUMENT)
+    return latex[:begin] if begin != -1 else None
+
+
+class FormatCache:
+    """
+    Precompiled preambles (pdflatex .fmt files dumped with mylatexformat). A
+    document's format is named after the hash of its dumped preamble, so an
+    edited template gets a fresh format. Formats are built one at a time on a
+    background thread, never inside a render: until a document's format is
+    ready it compiles without one. Preambles that fail to dump are remembered
+    and always compiled without a format.
+    """
+
+    def __init__(self, path: str, build_timeout: float = 120.0):
+        self.path = os.path.abspath(path)
+        self.build_timeout = build_timeout
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._failed: set[str] = set()
+        self._queued: dict[str, str] = {}  # name -> preamble, waiting or being built
+        self._builder: threading.Thread | None = None
+
+    def env(self) -> dict:
+        # Trailing separator keeps the default TeX search path after ours
+        return {**os.environ, "TEXFORMATS": self.path + os.pathsep}
+
+    def format_for(self, latex: str) -> str | None:
+        """The ready format for `latex`'s preamble; None (after queueing a build if needed) when there is none yet."""
+        preamble = _dumped_preamble(latex)
+        if preamble is None:
+            return None
+        name = "resume-" + hashlib.sha256(preamble.encode("utf-8")).hexdigest()[:16]
+        if os.path.exists(os.path.join(self.path, f"{name}.fmt")):
+            return name
+        with self._lock:
+            if name not in self._failed and name not in self._queued:
+                self._queued[name] = preamble
+                if self._builder is None:
+                    self._builder = threading.Thread(target=self._build_queued, name="latex-format-builder", daemon=True)
+                    self._builder.start()
+        return None
+
+    def prepare(self, latex: str):
+        """Queue a build of `latex`'s format (e.g. a template's, at startup) without waiting for it."""
+        self.format_for(latex)
+
+    def _build_queued(self):
+        while True:
+            with self._lock:
+                if not self._queued:
+                    self._builder = None
+                    return
+                name, preamble = next(iter(self._queued.items()))
+            built = os.path.exists(os.path.join(self.path, f"{name}.fmt")) or self._build(name, preamble)
+            with self._lock:
+                del self._queued[name]
+                if not built:
+                    self._failed.add(name)
+
+    def discard(self, name: str):
+        with self._lock:
+            self._failed.add(name)
+            try:
+                os.remove(os.path.join(self.path, f"{name}.fmt"))
+            except FileNotFoundError:
+                pass
+
+    def _build(self, name: str, preamble: str) -> bool:
+        with tempfile.TemporaryDirectory(dir=self.path) as build_dir:
+            with open(os.path.join(build_dir, "preamble.tex"), "w") as f:
+                f.write(preamble + "\n\\begin{document}\\end{document}\n")
+            try:
+                result = subprocess.run(
+                    ["pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={name}", "&pdflatex", "mylatexformat.ltx", "preamble.tex"],
+                    cwd=build_dir,
+                    capture_output=True,
+                    timeout=self.build_timeout,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return False
+            fmt_file = os.path.join(build_dir, f"{name}.fmt")
+            if result.returncode != 0 or not os.path.exists(fmt_file):
+                return False
+            os.replace(fmt_file, os.path.join(self.path, f"{name}.fmt"))
+        return True
+
+
+class PdfRenderer:
+    """
+    Runs at most `workers` pdflatex jobs at once and queues up to `queue_size`
+    more; beyond that `render` raises RenderQueueFull so callers can shed load
+    instead of piling up. Each job is killed after `timeout` seconds. With a
+    FormatCache, documents compile against their precompiled preamble once it
+    has been built.
+    """
+
+    def __init__(self, workers: int | None = None, queue_size: int | None = None, timeout: float = 30.0, formats: FormatCache | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.formats = formats
+        self.queue_size = queue_size if queue_size is not None else self.workers * 4
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def render(self, latex: str) -> bytes:
+        if self._pending >= self.workers + self.queue_size:
+            raise RenderQueueFull(f"PDF render queue is full ({self._pending} jobs pending)")
+        self._pending += 1
+        try:
+            async with self._slots:
+                try:
+                    return await asyncio.wait_for(self._compile(latex), self.timeout)
+                except asyncio.TimeoutError:
+                    raise RenderTimeout(f"pdflatex did not finish within {self.timeout:g}s")
+        finally:
+            self._pending -= 1
+
+    async def _compile(self, latex: str) -> bytes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tex_file = os.path.join(temp_dir, "resume.tex")
+
+            with open(tex_file, 'w') as f:
+                f.write(latex)
+
+            # Never waits on a format build: those run on the FormatCache's own thread
+            fmt = self.formats.format_for(latex) if self.formats else None
+            if fmt:
+                try:
+                    return await self._passes(temp_dir, tex_file, fmt)
+                except RuntimeError:
+                    pass
+            pdf = await self._passes(temp_dir, tex_file, None)
+            if fmt:
+                # The plain compile worked, so the format itself was stale or broken
+                self.formats.discard(fmt)
+            return pdf
+
+    async def _passes(self, temp_dir: str, tex_file: str, fmt: str | None) -> bytes:
+        env = self.formats.env() if fmt else None
+        for _ in range(MAX_PASSES):
+            stdout, stderr, returncode = await self._run(pdflatex_command(temp_dir, tex_file, fmt), temp_dir, env)
+            if returncode != 0:
+                raise RuntimeError(f"pdflatex compilation failed:\n{stdout}\n{stderr}")
+            if not needs_rerun(os.path.join(temp_dir, "resume.log")):
+                break
+
+        with open(os.path.join(temp_dir, "resume.pdf"), "rb") as f:
+            return f.read()
+
+    async def _run(self, command: list[str], cwd: str, env: dict | None = None) -> tuple[str, str, int]:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Timed out or client went away: don't leave pdflatex running
+            process.kill()
+            await process.wait()
+            raise
+        return stdout.decode(errors="replace"), stderr.decode(errors="replace"), process.returncode
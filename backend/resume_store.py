@@ -0,0 +1,143 @@
+"""
+Async data access for saved resumes.
+
+SupabaseResumeStore talks to PostgREST over the shared pooled client with
+timeouts and retries; MemoryResumeStore keeps rows in-process for local runs
+and benchmarks (RESUME_STORE=memory). Both expose the same coroutines.
+"""
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+
+LIST_COLUMNS = "id,name,created_at,updated_at"
+
+
+class StoreError(RuntimeError):
+    pass
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _quote(value: str) -> str:
+    """A double-quoted PostgREST filter value; reserved characters inside stay literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class SupabaseResumeStore:
+
+    def __init__(self, client: httpx.AsyncClient, service_key: str, retries: int = 2):
+        self.client = client
+        self.retries = retries
+        self._headers = {"Authorization": f"Bearer {service_key}"}
+
+    async def list_resumes(self, user_id: str, limit: int | None = None, after: tuple[str, str] | None = None) -> list[dict]:
+        """Newest first; `after` is the (updated_at, id) of the last row already seen."""
+        params = {"select": LIST_COLUMNS, "user_id": f"eq.{user_id}", "order": "updated_at.desc,id.desc"}
+        if limit is not None:
+            params["limit"] = str(limit)
+        if after is not None:
+            updated_at, resume_id = after
+            updated_at, resume_id = _quote(updated_at), _quote(resume_id)
+            params["or"] = f"(updated_at.lt.{updated_at},and(updated_at.eq.{updated_at},id.lt.{resume_id}))"
+        return await self._request("GET", params)
+
+    async def create_resume(self, user_id: str, fields: dict) -> dict | None:
+        rows = await self._request("POST", {}, json={**fields, "user_id": user_id}, idempotent=False)
+        return rows[0] if rows else None
+
+    async def get_resume(self, user_id: str, resume_id: str, columns: str = "*") -> dict | None:
+        rows = await self._request("GET", {"select": columns, "id": f"eq.{resume_id}", "user_id": f"eq.{user_id}"})
+        return rows[0] if rows else None
+
+    async def update_resume(self, user_id: str, resume_id: str, fields: dict, if_updated_at: str | None = None) -> dict | None:
+        """None if the row doesn't exist or, with `if_updated_at`, was changed since."""
+        params = {"id": f"eq.{resume_id}", "user_id": f"eq.{user_id}"}
+        if if_updated_at is not None:
+            params["updated_at"] = f"eq.{if_updated_at}"
+        rows = await self._request("PATCH", params, json={**fields, "updated_at": _now()})
+        return rows[0] if rows else None
+
+    async def delete_resume(self, user_id: str, resume_id: str) -> bool:
+        return bool(await self._request("DELETE", {"id": f"eq.{resume_id}", "user_id": f"eq.{user_id}"}))
+
+    async def _request(self, method: str, params: dict, json: dict | None = None, idempotent: bool = True) -> list[dict]:
+        """
+        One PostgREST call returning the affected rows. Connection failures are
+        always retried (nothing was sent); timeouts and 5xx only when idempotent.
+        """
+        headers = {**self._headers, "Prefer": "return=representation"}
+        for attempt in range(self.retries + 1):
+            retry = attempt < self.retries
+            try:
+                response = await self.client.request(method, "/rest/v1/resumes", params=params, json=json, headers=headers)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if not retry:
+                    raise StoreError(f"Supabase unreachable: {e}")
+            except httpx.TransportError as e:
+                if not (retry and idempotent):
+                    raise StoreError(f"Supabase request failed: {e}")
+            else:
+                if response.status_code < 400:
+                    return response.json()
+                if response.status_code < 500 or not (retry and idempotent):
+                    raise StoreError(f"Supabase error {response.status_code}: {response.text}")
+            await asyncio.sleep(0.1 * 2 ** attempt)
+
+
+class MemoryResumeStore:
+
+    def __init__(self):
+        self._rows: dict[str, dict] = {}
+
+    async def list_resumes(self, user_id: str, limit: int | None = None, after: tuple[str, str] | None = None) -> list[dict]:
+        rows = [row for row in self._rows.values() if row["user_id"] == user_id]
+        if after is not None:
+            rows = [row for row in rows if (row["updated_at"], row["id"]) < tuple(after)]
+        rows.sort(key=lambda row: (row["updated_at"], row["id"]), reverse=True)
+        return [{column: row[column] for column in LIST_COLUMNS.split(",")} for row in rows[:limit]]
+
+    async def create_resume(self, user_id: str, fields: dict) -> dict | None:
+        now = _now()
+        row = {"id": str(uuid.uuid4()), "name": None, "full_resume": None, "tailored_resume": None,
+               **fields, "user_id": user_id, "created_at": now, "updated_at": now}
+        self._rows[row["id"]] = row
+        return dict(row)
+
+    async def get_resume(self, user_id: str, resume_id: str, columns: str = "*") -> dict | None:
+        row = self._owned(user_id, resume_id)
+        if row is None:
+            return None
+        return dict(row) if columns == "*" else {column: row[column] for column in columns.split(",")}
+
+    async def update_resume(self, user_id: str, resume_id: str, fields: dict, if_updated_at: str | None = None) -> dict | None:
+        row = self._owned(user_id, resume_id)
+        if row is None or (if_updated_at is not None and row["updated_at"] != if_updated_at):
+            return None
+        row.update(fields, updated_at=_now())
+        return dict(row)
+
+    async def delete_resume(self, user_id: str, resume_id: str) -> bool:
+        if self._owned(user_id, resume_id) is None:
+            return False
+        del self._rows[resume_id]
+        return True
+
+    def _owned(self, user_id: str, resume_id: str) -> dict | None:
+        row = self._rows.get(resume_id)
+        return row if row is not None and row["user_id"] == user_id else None
+
+
+def create_resume_store():
+    """Store selected by RESUME_STORE: supabase (default) or memory."""
+    kind = os.getenv("RESUME_STORE", "supabase")
+    if kind == "memory":
+        return MemoryResumeStore()
+    if kind == "supabase":
+        from supabase_client import SUPABASE_SERVICE_KEY, get_http_client
+        return SupabaseResumeStore(get_http_client(), SUPABASE_SERVICE_KEY, retries=int(os.getenv("SUPABASE_RETRIES", "2")))
+    raise ValueError(f"Unknown RESUME_STORE '{kind}', expected supabase or memory")
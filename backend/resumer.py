@@ -3,15 +3,65 @@ import subprocess
 import tempfile
 import shutil
 import os
-import re
-from models import Resume, Bullet
+import threading
+import numpy as np
+from models import Resume
+from keywords import keyword_matcher
+from latex_template import CompiledTemplate, escape_latex, load_template
 from relevance import Relevance
+from renderer import MAX_PASSES, needs_rerun, pdflatex_command
+from page_fit import PageMetrics, fit_to_page
+from tailor_cache import TailorState
+
+SIM_WEIGHT = 0.4
+IMP_WEIGHT = 0.6
+# Keywords: any literal (or alias) match outranks any purely semantic one
+MATCH_WEIGHT = 0.7
+KEYWORD_SIM_WEIGHT = 0.3
 
 
 class Resumer:
 
     def __init__(self):
-        self.relevance_engine = Relevance()
+        # The embedding model is loaded on first use or by start_loading(), so
+        # rendering and CRUD never wait on it
+        self._relevance_engine: Relevance | None = None
+        self._relevance_lock = threading.Lock()
+        self._loader: threading.Thread | None = None
+        self.load_error: Exception | None = None
+
+    @property
+    def relevance_engine(self) -> Relevance:
+        return self._relevance_engine or self.load_model()
+
+    def load_model(self) -> Relevance:
+        with self._relevance_lock:
+            if self._relevance_engine is None:
+                try:
+                    self._relevance_engine = Relevance()
+                except Exception as e:
+                    self.load_error = e
+                    raise
+            return self._relevance_engine
+
+    @property
+    def model_ready(self) -> bool:
+        return self._relevance_engine is not None
+
+    def start_loading(self):
+        """Load the embedding model in a background thread (idempotent)."""
+        with self._relevance_lock:
+            if self._relevance_engine is not None or (self._loader is not None and self._loader.is_alive()):
+                return
+            self.load_error = None
+            self._loader = threading.Thread(target=self._load_in_background, name="relevance-loader", daemon=True)
+            self._loader.start()
+
+    def _load_in_background(self):
+        try:
+            self.load_model()
+        except Exception:
+            pass  # Kept in load_error for readiness checks
 
     def load_resume(self, data_file_path: str = "../data/data.json") -> Resume:
         with open(data_file_path, 'r') as f:
@@ -31,14 +81,16 @@ class Resumer:
             with open(tex_file, 'w') as f:
                 f.write(latex_resume)
 
-            for _ in range(2):
+            for _ in range(MAX_PASSES):
                 result = subprocess.run(
-                    ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, tex_file],
+                    pdflatex_command(temp_dir, tex_file),
                     capture_output=True,
                     text=True
                 )
                 if result.returncode != 0:
                     raise RuntimeError(f"pdflatex compilation failed:\n{result.stdout}\n{result.stderr}")
+                if not needs_rerun(os.path.join(temp_dir, "resume.log")):
+                    break
 
             pdf_file = os.path.join(temp_dir, "resume.pdf")
             shutil.copy(pdf_file, output_path)
@@ -50,19 +102,18 @@ class Resumer:
             f.write(latex_resume)
     
     def resume_to_latex_from_template(self, resume: Resume, template_path: str = "../data/templates/jake_template.tex") -> str:
-        with open(template_path, 'r') as f:
-            content = f.read()
-        
-        content = content.replace("{{FULL_NAME}}", self._escape_latex(resume.full_name or ""))
-        content = content.replace("{{CONTACT_LINE}}", self._generate_contact_line(resume))
-        
-        content = content.replace("{{EDUCATION_ENTRIES}}", self._generate_education_latex(resume))
-        content = content.replace("{{EXPERIENCE_ENTRIES}}", self._generate_experience_latex(resume))
-        content = content.replace("{{PROJECT_ENTRIES}}", self._generate_projects_latex(resume))
-        content = content.replace("{{LANGUAGES_LIST}}", self._generate_languages_list(resume))
-        content = content.replace("{{TECHNOLOGIES_LIST}}", self._generate_technologies_list(resume))
+        return self.resume_to_latex(resume, load_template(template_path))
 
-        return content
+    def resume_to_latex(self, resume: Resume, template: CompiledTemplate) -> str:
+        return template.render({
+            "FULL_NAME": self._escape_latex(resume.full_name or ""),
+            "CONTACT_LINE": self._generate_contact_line(resume),
+            "EDUCATION_ENTRIES": self._generate_education_latex(resume),
+            "EXPERIENCE_ENTRIES": self._generate_experience_latex(resume),
+            "PROJECT_ENTRIES": self._generate_projects_latex(resume),
+            "LANGUAGES_LIST": self._generate_languages_list(resume),
+            "TECHNOLOGIES_LIST": self._generate_technologies_list(resume),
+        })
 
     def _generate_contact_line(self, resume: Resume) -> str:
         parts = []
@@ -83,23 +134,7 @@ class Resumer:
         return " $|$ ".join(parts)
 
     def _escape_latex(self, text: str) -> str:
-        if not text:
-            return ""
-        replacements = [
-            ('\\', r'\textbackslash{}'),
-            ('&', r'\&'),
-            ('%', r'\%'),
-            ('$', r'\$'),
-            ('#', r'\#'),
-            ('_', r'\_'),
-            ('{', r'\{'),
-            ('}', r'\}'),
-            ('~', r'\textasciitilde{}'),
-            ('^', r'\textasciicircum{}'),
-        ]
-        for char, escape in replacements:
-            text = text.replace(char, escape)
-        return text
+        return escape_latex(text)
     
     def _generate_education_latex(self, resume: Resume) -> str:
         entries = []
@@ -164,57 +199,182 @@ class Resumer:
         resume.trim(exp_bullet_count, proj_bullet_count, tech_count, lang_count)
         return resume
 
-    def _populate_resume_metrics(self, resume: Resume, job_description: str):
-        bullets = resume.all_bullets()
-        
-        bullet_sims = self._get_bullet_similarities(bullets, job_description)
-        self._set_bullet_similarities(bullets, bullet_sims)
-        
-        bullet_scores = [bullet.calculate_score(sim_weight=0.4, imp_weight=0.6) for bullet in bullets]
-        self._set_bullet_scores(bullets, bullet_scores)
+    def retailor(self, source: dict, job_description: str, exp_bullet_count: int = 7, proj_bullet_count: int = 5, tech_count: int = 5, lang_count: int = 5, base: TailorState | None = None, fit: PageMetrics | None = None) -> tuple[Resume, TailorState]:
+        """
+        Tailor the resume dict `source`, reusing `base` (an earlier run) where
+        possible: an unchanged resume and job description is only re-trimmed,
+        and otherwise only bullet/keyword texts `base` hasn't seen are embedded.
+        With `fit`, the bullet counts are upper bounds and the result is further
+        trimmed to fit one page of that template.
+        Returns the tailored resume and the state to keep for the next edit.
+        """
+        if base is not None and base.matches(source, job_description):
+            tailored = base.scored.copy()
+            self._trim(tailored, exp_bullet_count, proj_bullet_count, tech_count, lang_count, fit)
+            return tailored, base
+        resume = Resume(source)
+        texts = self._scored_texts(resume)
+        similarities = self._lookup_similarities(texts, job_description, dict(self._known_similarities(base, job_description)))
 
-        self._populate_experience_metrics(resume)
-        self._populate_project_metrics(resume)
+        self._populate_resume_metrics(resume, job_description, similarities)
+        state = TailorState(source, job_description, resume.copy(), dict(zip(texts, similarities)))
+        self._trim(resume, exp_bullet_count, proj_bullet_count, tech_count, lang_count, fit)
+        return resume, state
+
+    def tailor_stream(self, source: dict, job_description: str, exp_bullet_count: int = 7, proj_bullet_count: int = 5, tech_count: int = 5, lang_count: int = 5, base: TailorState | None = None, fit: PageMetrics | None = None):
+        """
+        retailor(), yielding progress as it goes: ("skills", resume) with
+        keywords scored and trimmed, then ("section", (kind, index, section)) for
+        each experience/project (by input index) once its bullets are scored and
+        trimmed, and finally ("resume", (tailored, state)) as retailor() returns.
+        Keywords are encoded first since they are the smallest batch.
+        """
+        if base is not None and base.matches(source, job_description):
+            yield "resume", self.retailor(source, job_description, exp_bullet_count, proj_bullet_count, tech_count, lang_count, base=base, fit=fit)
+            return
+        known = dict(self._known_similarities(base, job_description))
+        resume = Resume(source)
 
         keywords = resume.all_keywords()
-        keyword_scores = self._get_keyword_scores(keywords, job_description)
+        keyword_sims = self._lookup_similarities([kw.text or "" for kw in keywords], job_description, known)
+        self._set_keyword_scores(keywords, self._get_keyword_scores(keywords, job_description, np.asarray(keyword_sims, dtype=np.float64)))
+        skills = resume.copy()
+        skills.sort_keywords_by_score()
+        skills.trim(exp_bullet_count, proj_bullet_count, tech_count, lang_count)
+        yield "skills", skills
+
+        for kind, sections, count in (("experience", resume.experience, exp_bullet_count), ("projects", resume.projects, proj_bullet_count)):
+            for index, section in enumerate(sections):
+                bullet_sims = self._lookup_similarities([bullet.text for bullet in section.bullets], job_description, known)
+                scored = section.copy()
+                self._score_entries([scored], np.asarray(bullet_sims, dtype=np.float64))
+                scored.bullets = scored.bullets[:count]
+                yield "section", (kind, index, scored)
+
+        # Every text is known by now; this final pass only ranks and re-scores
+        texts = self._scored_texts(resume)
+        similarities = self._lookup_similarities(texts, job_description, known)
+        self._populate_resume_metrics(resume, job_description, similarities)
+        state = TailorState(source, job_description, resume.copy(), dict(zip(texts, similarities)))
+        self._trim(resume, exp_bullet_count, proj_bullet_count, tech_count, lang_count, fit)
+        yield "resume", (resume, state)
+
+    def _trim(self, resume: Resume, exp_bullet_count: int, proj_bullet_count: int, tech_count: int, lang_count: int, fit: PageMetrics | None):
+        resume.trim(exp_bullet_count, proj_bullet_count, tech_count, lang_count)
+        if fit is not None:
+            fit_to_page(resume, fit)
+
+    def _known_similarities(self, base: TailorState | None, job_description: str) -> dict:
+        return base.similarities if base is not None and base.job_description == job_description else {}
+
+    def _lookup_similarities(self, texts: list[str], job_description: str, known: dict) -> list[float]:
+        """Similarities for `texts`, embedding only those missing from `known` and adding them to it."""
+        missing = [text for text in dict.fromkeys(texts) if text not in known]
+        if missing:
+            known.update(zip(missing, self._get_similarities(missing, job_description)))
+        return [known[text] for text in texts]
+
+    def tailor_many(self, resumes: list[Resume], job_descriptions: list[str], exp_bullet_count: int = 7, proj_bullet_count: int = 5, tech_count: int = 5, lang_count: int = 5) -> list[list[Resume]]:
+        """
+        Tailor every resume to every job description. Unique bullet texts and job
+        descriptions across the batch are encoded once; result[i][j] is resumes[i]
+        tailored to job_descriptions[j].
+        """
+        texts = list(dict.fromkeys(text for resume in resumes for text in self._scored_texts(resume)))
+        rows = {text: i for i, text in enumerate(texts)}
+        similarities = self.relevance_engine.similarity_matrix(texts, job_descriptions)
+
+        results = []
+        for resume in resumes:
+            resume_rows = np.array([rows[text] for text in self._scored_texts(resume)], dtype=np.intp)
+            tailored = []
+            for j, job_description in enumerate(job_descriptions):
+                copy = resume.copy()
+                self._populate_resume_metrics(copy, job_description, similarities[resume_rows, j])
+                copy.trim(exp_bullet_count, proj_bullet_count, tech_count, lang_count)
+                tailored.append(copy)
+            results.append(tailored)
+        return results
+
+    def _scored_texts(self, resume: Resume) -> list[str]:
+        """Texts embedded for a resume: every bullet, then every keyword."""
+        return [bullet.text for bullet in resume.all_bullets()] + [kw.text or "" for kw in resume.all_keywords()]
+
+    def _populate_resume_metrics(self, resume: Resume, job_description: str, similarities=None):
+        """
+        `similarities` is aligned with _scored_texts(resume); bullets and keywords
+        are encoded together in one call when it isn't given.
+        """
+        if similarities is None:
+            similarities = self._get_similarities(self._scored_texts(resume), job_description)
+        similarities = np.asarray(similarities, dtype=np.float64)
+        n_bullets = len(resume.all_bullets())
+        self._score_sections(resume, similarities[:n_bullets])
+
+        keywords = resume.all_keywords()
+        keyword_scores = self._get_keyword_scores(keywords, job_description, similarities[n_bullets:])
         self._set_keyword_scores(keywords, keyword_scores)
         resume.sort_keywords_by_score()
 
-    def _populate_experience_metrics(self, resume: Resume):
-        for experience in resume.experience:
-            experience.similarity = experience.avg_similarity()
-            experience.impressiveness = experience.avg_impressiveness()
-            experience.score = experience.calculate_score(sim_weight=0.4, imp_weight=0.6)
-            experience.sort_bullets_by_score()
-        resume.sort_experience_by_score()
-
-    def _populate_project_metrics(self, resume: Resume):
-        for project in resume.projects:
-            project.similarity = project.avg_similarity()
-            project.impressiveness = project.avg_impressiveness()
-            project.score = project.calculate_score(sim_weight=0.4, imp_weight=0.6)
-            project.sort_bullets_by_score()
-        resume.sort_projects_by_score()
-
-    def _get_bullet_similarities(self, bullets: list[Bullet], job_description: str) -> list[float]:
-        bullet_texts = [bullet.text for bullet in bullets]
-        return self.relevance_engine.calculate_similarities(bullet_texts, job_description)
-
-    def _set_bullet_similarities(self, bullets: list[Bullet], similarities: list[float]):
-        for bullet, sim in zip(bullets, similarities):
-            bullet.similarity = sim
+    def _score_sections(self, resume: Resume, bullet_sims: np.ndarray):
+        """Score every section's bullets, then order experiences and projects by score."""
+        section_scores = self._score_entries(resume.experience + resume.projects, bullet_sims)
+        n_exp = len(resume.experience)
+        resume.experience = [resume.experience[i] for i in np.argsort(-section_scores[:n_exp], kind="stable").tolist()]
+        resume.projects = [resume.projects[i] for i in np.argsort(-section_scores[n_exp:], kind="stable").tolist()]
 
-    def _set_bullet_scores(self, bullets: list[Bullet], scores: list[float]):
-        for bullet, score in zip(bullets, scores):
+    def _score_entries(self, sections: list, bullet_sims: np.ndarray) -> np.ndarray:
+        """
+        Score bullets and sections in one columnar pass. Bullet metrics are
+        packed into arrays with an owner index per bullet, section averages come
+        from bincount over owners, and results (including the score-ordered
+        bullets) are written back to the models once. Returns section scores.
+        Matches Bullet.calculate_score / avg_* semantics: missing values count as
+        0.5, and in averages so do zeros.
+        """
+        counts = np.array([len(section.bullets) for section in sections], dtype=np.intp)
+        owners = np.repeat(np.arange(len(sections)), counts)
+        bullets = [bullet for section in sections for bullet in section.bullets]
+        impressiveness = np.array([np.nan if b.impressiveness is None else b.impressiveness for b in bullets], dtype=np.float64)
+
+        sims_or_default = np.where(np.isnan(bullet_sims), 0.5, bullet_sims)
+        imps_or_default = np.where(np.isnan(impressiveness), 0.5, impressiveness)
+        bullet_scores = sims_or_default * SIM_WEIGHT + imps_or_default * IMP_WEIGHT
+
+        def section_mean(values):
+            totals = np.bincount(owners, weights=np.where(values == 0, 0.5, values), minlength=len(sections))
+            return np.divide(totals, counts, out=np.full(len(sections), 0.5), where=counts > 0)
+
+        section_sims = section_mean(sims_or_default)
+        section_imps = section_mean(imps_or_default)
+        section_scores = section_sims * SIM_WEIGHT + section_imps * IMP_WEIGHT
+
+        # Stable: ties keep their input order, like list.sort(reverse=True)
+        bullet_order = np.lexsort((-bullet_scores, owners))
+        for bullet, sim, score in zip(bullets, bullet_sims.tolist(), bullet_scores.tolist()):
+            bullet.similarity = sim
             bullet.score = score
+        start = 0
+        for section, count, sim, imp, score in zip(sections, counts.tolist(), section_sims.tolist(), section_imps.tolist(), section_scores.tolist()):
+            section.similarity = sim
+            section.impressiveness = imp
+            section.score = score
+            section.bullets = [bullets[i] for i in bullet_order[start:start + count].tolist()]
+            start += count
+        return section_scores
 
-    def _get_keyword_scores(self, keywords: list, job_description: str) -> list[float]:
-        return [self._calculate_keyword_score(kw.text, job_description) for kw in keywords]
-    
-    def _calculate_keyword_score(self, keyword: str, job_description: str) -> float:
-        pattern = rf'\b{re.escape(keyword)}\b'
-        return 1.0 if re.search(pattern, job_description, re.IGNORECASE) else 0.0
+    def _get_similarities(self, texts: list[str], job_description: str) -> list[float]:
+        return self.relevance_engine.calculate_similarities(texts, job_description)
+
+    def _get_keyword_scores(self, keywords: list, job_description: str, similarities: np.ndarray) -> list[float]:
+        """
+        Graded keyword relevance: literal/alias occurrences in the job description
+        (saturating, 1 -> 0.5, 2 -> 0.75, ...) blended with embedding similarity.
+        """
+        matcher = keyword_matcher(tuple(kw.text or "" for kw in keywords))
+        counts = np.array(matcher.counts(job_description), dtype=np.float64)
+        frequency = 1.0 - 0.5 ** counts
+        return (frequency * MATCH_WEIGHT + similarities * KEYWORD_SIM_WEIGHT).tolist()
 
     def _set_keyword_scores(self, keywords: list, scores: list[float]):
         for keyword, score in zip(keywords, scores):
@@ -0,0 +1,90 @@
+"""
+Micro-batching scheduler in front of the embedding model.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import numpy as np
+
+
+class _Job:
+    __slots__ = ("texts", "prompt_name", "future")
+
+    def __init__(self, texts: list[str], prompt_name: str | None):
+        self.texts = texts
+        self.prompt_name = prompt_name
+        self.future: Future = Future()
+
+
+class EmbeddingScheduler:
+    """
+    Merges encode requests from concurrent callers into one model call.
+
+    A single worker thread owns the model: it takes the first queued job, keeps
+    collecting jobs for up to `max_wait` seconds or until `max_batch_size` texts
+    are pending, encodes each prompt group and resolves every caller's future
+    with its own rows. No model call gets more than `max_batch_size` texts:
+    larger groups (including a single oversized request) are encoded in slices.
+    """
+
+    def __init__(self, encode: Callable[[list[str], str | None], np.ndarray], max_batch_size: int = 64, max_wait: float = 0.005):
+        self._encode = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: queue.Queue[_Job] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="embedding-scheduler", daemon=True)
+        self._worker.start()
+
+    def submit(self, texts: list[str], prompt_name: str | None = None) -> Future:
+        job = _Job(texts, prompt_name)
+        self._queue.put(job)
+        return job.future
+
+    def encode(self, texts: list[str], prompt_name: str | None = None) -> np.ndarray:
+        return self.submit(texts, prompt_name).result()
+
+    def _run(self):
+        while True:
+            jobs = self._collect()
+            groups: dict[str | None, list[_Job]] = {}
+            for job in jobs:
+                groups.setdefault(job.prompt_name, []).append(job)
+            for prompt_name, group in groups.items():
+                self._encode_group(prompt_name, group)
+
+    def _collect(self) -> list[_Job]:
+        jobs = [self._queue.get()]
+        pending = len(jobs[0].texts)
+        deadline = time.monotonic() + self.max_wait
+        while pending < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            jobs.append(job)
+            pending += len(job.texts)
+        return jobs
+
+    def _encode_group(self, prompt_name: str | None, jobs: list[_Job]):
+        # Concurrent requests often share texts (same posting, same bullets)
+        rows = {}
+        for job in jobs:
+            for text in job.texts:
+                rows.setdefault(text, len(rows))
+        texts = list(rows)
+        try:
+            embeddings = np.concatenate([
+                np.asarray(self._encode(texts[start:start + self.max_batch_size], prompt_name))
+                for start in range(0, max(len(texts), 1), self.max_batch_size)
+            ])
+        except Exception as e:
+            for job in jobs:
+                job.future.set_exception(e)
+            return
+
+        for job in jobs:
+            job.future.set_result(embeddings[[rows[text] for text in job.texts]])
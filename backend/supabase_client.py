@@ -1,39 +1,78 @@
 """
-Supabase client initialization.
+Supabase access over one shared, pooled async HTTP client (PostgREST and Auth).
 """
 import os
-from supabase import create_client, Client
+
+import httpx
 from dotenv import load_dotenv
 
+from jwt_verifier import JWTVerifier
+
 load_dotenv()
 
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_KEY")
 SUPABASE_ANON_KEY = os.environ.get("SUPABASE_ANON_KEY")
+# Legacy HS256 projects sign with this secret; projects on asymmetric keys publish a JWKS instead
+SUPABASE_JWT_SECRET = os.environ.get("SUPABASE_JWT_SECRET")
+
+_http_client: httpx.AsyncClient | None = None
 
-supabase: Client | None = None
 
-def get_supabase() -> Client:
-    """Get or create Supabase client (service role for backend)."""
-    global supabase
-    if supabase is None:
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared client (service role). Connections are pooled across requests."""
+    global _http_client
+    if _http_client is None:
         if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
             raise RuntimeError("Supabase credentials not configured. Set SUPABASE_URL and SUPABASE_SERVICE_KEY.")
-        supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
-    return supabase
+        _http_client = httpx.AsyncClient(
+            base_url=SUPABASE_URL.rstrip("/"),
+            headers={"apikey": SUPABASE_SERVICE_KEY},
+            timeout=httpx.Timeout(float(os.environ.get("SUPABASE_TIMEOUT_SECONDS", "10")), connect=5.0),
+            limits=httpx.Limits(
+                max_connections=int(os.environ.get("SUPABASE_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.environ.get("SUPABASE_MAX_CONNECTIONS", "20")),
+            ),
+        )
+    return _http_client
 
 
-def verify_jwt(token: str) -> dict | None:
-    """
-    Verify a Supabase JWT and return the user info.
-    Returns None if invalid.
-    """
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _verify_remotely(token: str) -> dict | None:
+    """Ask Supabase Auth about the token (one network round-trip)."""
     try:
-        client = get_supabase()
-        # Use the token to get user info
-        user_response = client.auth.get_user(token)
-        if user_response and user_response.user:
-            return {"id": str(user_response.user.id), "email": user_response.user.email}
-        return None
+        response = await get_http_client().get("/auth/v1/user", headers={"Authorization": f"Bearer {token}"})
+        if response.status_code != 200:
+            return None
+        user = response.json()
+        return {"id": str(user["id"]), "email": user.get("email")}
     except Exception:
         return None
+
+
+_verifier = JWTVerifier(
+    secret=SUPABASE_JWT_SECRET,
+    jwks_url=f"{SUPABASE_URL.rstrip('/')}/auth/v1/.well-known/jwks.json" if SUPABASE_URL else None,
+    audience=os.environ.get("SUPABASE_JWT_AUDIENCE", "authenticated"),
+    ttl=float(os.environ.get("JWT_CACHE_TTL_SECONDS", "60")),
+    fallback=_verify_remotely if SUPABASE_URL and SUPABASE_SERVICE_KEY else None,
+)
+
+
+def auth_configured() -> bool:
+    return bool(SUPABASE_JWT_SECRET or SUPABASE_URL)
+
+
+async def verify_jwt(token: str) -> dict | None:
+    """
+    Verify a Supabase JWT and return the user info.
+    Checked locally against the JWT secret or cached JWKS; Supabase Auth is only
+    asked when the signing key is unknown. Returns None if invalid.
+    """
+    return await _verifier.verify(token)
@@ -0,0 +1,55 @@
+"""
+Recent tailoring results, addressable by version id, so a resume that was just
+tailored can be re-tailored after an edit without redoing unchanged work.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+
+from models import Resume
+
+
+class TailorState:
+    """
+    One tailoring run: the resume as submitted, the job description, the scored
+    but untrimmed result and the similarity of every bullet/keyword text.
+    """
+
+    __slots__ = ("source", "job_description", "scored", "similarities")
+
+    def __init__(self, source: dict, job_description: str, scored: Resume, similarities: dict[str, float]):
+        self.source = source
+        self.job_description = job_description
+        self.scored = scored
+        self.similarities = similarities
+
+    def matches(self, source: dict, job_description: str) -> bool:
+        """True if re-tailoring `source` against `job_description` only needs a re-trim."""
+        return self.job_description == job_description and self.source == source
+
+
+class TailorCache:
+    """Bounded LRU of TailorState by version id."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, TailorState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: str | None) -> TailorState | None:
+        if not version:
+            return None
+        with self._lock:
+            state = self._entries.get(version)
+            if state is not None:
+                self._entries.move_to_end(version)
+            return state
+
+    def put(self, state: TailorState) -> str:
+        """Store `state` and return its new version id."""
+        version = uuid.uuid4().hex
+        with self._lock:
+            self._entries[version] = state
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return version
@@ -0,0 +1,75 @@
+import os
+import sys
+import tempfile
+import zlib
+
+import numpy as np
+import pytest
+from fastapi import Header
+from fastapi.testclient import TestClient
+
+# Backend modules import each other by bare name, as when run from backend/
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+# Importing api must not load the embedding model or write to the shared data/cache
+_scratch = tempfile.mkdtemp(prefix="resumer-tests-")
+os.environ.setdefault("PRELOAD_MODEL", "false")
+os.environ.setdefault("EMBEDDING_CACHE_DIR", "")
+os.environ.setdefault("RENDER_CACHE_DIR", os.path.join(_scratch, "renders"))
+os.environ.setdefault("LATEX_FORMAT_DIR", os.path.join(_scratch, "formats"))
+os.environ.setdefault("TEMPLATE_DIR", os.path.join(BACKEND, "..", "data", "templates"))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    TestClient on the API with RESUME_STORE=memory. The caller is whoever the
+    X-Test-User header names (user-1 by default) instead of a verified token.
+    """
+    import api
+
+    def current_user(x_test_user: str = Header("user-1")) -> dict:
+        return {"id": x_test_user, "email": f"{x_test_user}@example.com"}
+
+    monkeypatch.setenv("RESUME_STORE", "memory")
+    monkeypatch.setattr(api, "_resume_store", None)
+    api.app.dependency_overrides[api.get_current_user] = current_user
+    yield TestClient(api.app)
+    api.app.dependency_overrides.clear()
+
+
+class StubRelevance:
+    """
+    Stand-in for Relevance: a deterministic similarity per (text, target) pair,
+    with every text sent to the "model" recorded in `encoded`.
+    """
+
+    def __init__(self):
+        self.encoded: list[str] = []
+        self.targets: list[str] = []
+
+    @staticmethod
+    def similarity(text: str, target: str) -> float:
+        return zlib.crc32(f"{text}\x00{target}".encode("utf-8")) % 1000 / 1000
+
+    def calculate_similarities(self, strings: list[str], target: str) -> list[float]:
+        return self.similarity_matrix(strings, [target])[:, 0].tolist()
+
+    def similarity_matrix(self, strings: list[str], targets: list[str]) -> np.ndarray:
+        self.encoded += strings
+        self.targets += targets
+        return np.array([[self.similarity(s, t) for t in targets] for s in strings], dtype=np.float32).reshape(len(strings), len(targets))
+
+    def cache_stats(self) -> dict:
+        return {}
+
+
+@pytest.fixture
+def stub_model(monkeypatch) -> StubRelevance:
+    """The API's resumer with StubRelevance loaded in place of the embedding model."""
+    import api
+
+    model = StubRelevance()
+    monkeypatch.setattr(api.resumer, "_relevance_engine", model)
+    return model
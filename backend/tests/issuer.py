@@ -0,0 +1,61 @@
+"""
+A local stand-in for the Supabase token issuer: signs access tokens with an
+HS256 secret or ES256 keys and serves the public keys as a JWKS on localhost.
+Used by test_jwt_verifier.py and benchmarks/bench_auth.py.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec
+
+SECRET = "local-issuer-secret-with-enough-bytes-for-hs256"
+
+
+class Issuer:
+    """
+    Signs Supabase-shaped access tokens and serves its public keys as a JWKS.
+    add_key() publishes another key, as when the project rotates signing keys.
+    """
+
+    def __init__(self):
+        self.keys: dict[str, ec.EllipticCurvePrivateKey] = {}
+        self.jwks_requests = 0
+        self.add_key("local-1")
+        issuer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                issuer.jwks_requests += 1
+                body = issuer.jwks()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.jwks_url = f"http://127.0.0.1:{self.server.server_port}/auth/v1/.well-known/jwks.json"
+
+    def add_key(self, kid: str):
+        self.keys[kid] = ec.generate_private_key(ec.SECP256R1())
+
+    def jwks(self) -> bytes:
+        keys = []
+        for kid, key in self.keys.items():
+            jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(key.public_key()))
+            keys.append({**jwk, "kid": kid, "alg": "ES256", "use": "sig"})
+        return json.dumps({"keys": keys}).encode()
+
+    def token(self, alg: str = "HS256", kid: str = "local-1", secret: str = SECRET, **claims) -> str:
+        """A signed token; an unpublished kid is signed with a fresh key only the issuer knows."""
+        payload = {"sub": "user-1", "email": "jane@example.com", "aud": "authenticated", "exp": int(time.time()) + 3600, **claims}
+        if alg == "HS256":
+            return jwt.encode(payload, secret, algorithm="HS256")
+        key = self.keys.get(kid) or ec.generate_private_key(ec.SECP256R1())
+        return jwt.encode(payload, key, algorithm="ES256", headers={"kid": kid})
@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+
+from embedding_cache import DiskVectorStore, EmbeddingCache
+
+
+def test_vectors_survive_reopen(tmp_path):
+    store = DiskVectorStore(str(tmp_path), "float32")
+    store.put_many([("a", np.array([1.0, 0.0])), ("b", np.array([0.0, 1.0]))])
+
+    reopened = DiskVectorStore(str(tmp_path), "float32")
+    found = reopened.get_many(["a", "b", "c"])
+    assert set(found) == {"a", "b"}
+    np.testing.assert_array_equal(found["b"], [0.0, 1.0])
+
+
+def test_orphaned_rows_do_not_shift_later_keys(tmp_path):
+    store = DiskVectorStore(str(tmp_path), "float32")
+    store.put_many([("a", np.array([1.0, 1.0]))])
+    # A writer crashed after appending its vectors but before indexing them, mid-row
+    with open(os.path.join(tmp_path, "vectors.bin"), "ab") as f:
+        f.write(np.array([9.0, 9.0, 9.0], dtype=np.float32).tobytes())
+    with open(os.path.join(tmp_path, "index.txt"), "a") as f:
+        f.write("torn")
+
+    reopened = DiskVectorStore(str(tmp_path), "float32")
+    reopened.put_many([("b", np.array([2.0, 2.0]))])
+
+    found = DiskVectorStore(str(tmp_path), "float32").get_many(["a", "b", "torn"])
+    assert set(found) == {"a", "b"}
+    np.testing.assert_array_equal(found["a"], [1.0, 1.0])
+    np.testing.assert_array_equal(found["b"], [2.0, 2.0])
+
+
+
+def test_cached_vectors_do_not_keep_the_batch_alive():
+    cache = EmbeddingCache(max_bytes=64)
+    batch = np.ones((200, 16), dtype=np.float32)
+    cache.put_many({str(i): row for i, row in enumerate(batch)})
+
+    assert cache.stats()["bytes"] <= 64
+    for vector in cache.get_many([str(i) for i in range(200)]).values():
+        assert vector.base is None
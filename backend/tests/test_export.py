@@ -0,0 +1,48 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+import api
+
+RESUME = {
+    "full_name": "Jane Doe",
+    "contacts": {"email": "jane@example.com"},
+    "education": [],
+    "experience": [{"employer": "Acme", "title": "Engineer", "location": "Toronto, ON", "duration": "2025",
+                    "bullets": [{"text": "Shipped 50% faster builds"}]}],
+    "projects": [],
+    "technologies": [{"text": "Docker"}],
+    "languages": [{"text": "Python"}],
+}
+
+
+def test_pdf_export_renders_latex_off_the_event_loop(monkeypatch, tmp_path):
+    threads = {}
+    to_latex = api.resumer.resume_to_latex
+
+    def resume_to_latex(resume, template):
+        threads["latex"] = threading.current_thread()
+        return to_latex(resume, template)
+
+    async def render(latex):
+        threads["loop"] = threading.current_thread()
+        return b"%PDF-1.5 " + latex.encode("utf-8")[:16]
+
+    monkeypatch.setattr(api.resumer, "resume_to_latex", resume_to_latex)
+    monkeypatch.setattr(api.pdf_renderer, "render", render)
+    monkeypatch.setattr(api, "render_cache", api.RenderCache(str(tmp_path)))
+    client = TestClient(api.app)
+
+    first = client.post("/export/pdf", json={"resume": RESUME})
+    assert first.status_code == 200
+    assert first.headers["X-Render-Cache"] == "miss"
+    assert threads["latex"] is not threads["loop"]
+
+    second = client.post("/export/pdf", json={"resume": RESUME})
+    assert second.headers["X-Render-Cache"] == "hit"
+    assert second.content == first.content
+
+
+def test_pdf_export_rejects_unknown_template():
+    response = TestClient(api.app).post("/export/pdf", json={"resume": RESUME, "template": "nope"})
+    assert response.status_code == 400
@@ -0,0 +1,122 @@
+import pytest
+
+from json_patch import PatchError, PatchTestFailed, apply_patch
+
+DOC = {"name": "CV", "full_resume": {"experience": [{"title": "a"}, {"title": "b"}], "gpa": 3.7, "open": True}}
+
+
+def test_add_replace_remove():
+    patched = apply_patch(DOC, [
+        {"op": "add", "path": "/full_resume/projects", "value": []},
+        {"op": "add", "path": "/full_resume/projects/-", "value": {"title": "p"}},
+        {"op": "add", "path": "/full_resume/experience/0", "value": {"title": "new"}},
+        {"op": "replace", "path": "/name", "value": "Resume"},
+        {"op": "remove", "path": "/full_resume/gpa"},
+    ])
+    assert patched == {"name": "Resume", "full_resume": {
+        "experience": [{"title": "new"}, {"title": "a"}, {"title": "b"}], "open": True, "projects": [{"title": "p"}],
+    }}
+
+
+def test_original_document_is_untouched():
+    value = {"title": "c"}
+    patched = apply_patch(DOC, [{"op": "add", "path": "/full_resume/experience/-", "value": value}])
+    value["title"] = "changed"
+    assert len(DOC["full_resume"]["experience"]) == 2
+    assert patched["full_resume"]["experience"][-1] == {"title": "c"}
+
+
+def test_move_and_copy():
+    patched = apply_patch(DOC, [
+        {"op": "copy", "from": "/full_resume/experience/0", "path": "/full_resume/experience/-"},
+        {"op": "move", "from": "/full_resume/experience/0", "path": "/full_resume/first"},
+        {"op": "move", "from": "/name", "path": "/name"},
+    ])
+    assert patched["full_resume"]["experience"] == [{"title": "b"}, {"title": "a"}]
+    assert patched["full_resume"]["first"] == {"title": "a"}
+    assert patched["name"] == "CV"
+
+
+def test_move_into_own_child_is_rejected():
+    with pytest.raises(PatchError):
+        apply_patch(DOC, [{"op": "move", "from": "/full_resume", "path": "/full_resume/experience/0/nested"}])
+
+
+def test_replace_root():
+    assert apply_patch(DOC, [{"op": "replace", "path": "", "value": {"name": "x"}}]) == {"name": "x"}
+
+
+def test_pointer_escapes():
+    doc = {"a/b": 1, "m~n": 2}
+    patched = apply_patch(doc, [
+        {"op": "test", "path": "/a~1b", "value": 1},
+        {"op": "replace", "path": "/m~0n", "value": 3},
+        {"op": "add", "path": "/~01", "value": 4},
+    ])
+    assert patched == {"a/b": 1, "m~n": 3, "~1": 4}
+
+
+@pytest.mark.parametrize("operation", [
+    {"op": "add", "path": "/full_resume/experience/3", "value": {}},
+    {"op": "replace", "path": "/full_resume/experience/2", "value": {}},
+    {"op": "remove", "path": "/full_resume/experience/-"},
+    {"op": "replace", "path": "/full_resume/experience/01", "value": {}},
+    {"op": "remove", "path": "/full_resume/experience/-1"},
+    {"op": "remove", "path": "/full_resume/experience/²"},
+    {"op": "remove", "path": "/missing"},
+    {"op": "add", "path": "/name/x", "value": 1},
+    {"op": "add", "path": "name", "value": 1},
+    {"op": "add", "path": 5, "value": 1},
+    {"op": "add", "path": "/name"},
+    {"op": "copy", "path": "/name"},
+    {"op": "remove", "path": ""},
+    {"op": "frobnicate", "path": "/name"},
+    {"path": "/name"},
+    "not an operation",
+], ids=repr)
+def test_invalid_operations(operation):
+    with pytest.raises(PatchError) as raised:
+        apply_patch(DOC, [operation])
+    assert not isinstance(raised.value, PatchTestFailed)
+
+
+def test_index_equal_to_length_appends_on_add():
+    patched = apply_patch(DOC, [{"op": "add", "path": "/full_resume/experience/2", "value": {"title": "c"}}])
+    assert patched["full_resume"]["experience"][-1] == {"title": "c"}
+
+
+@pytest.mark.parametrize("path, value", [
+    ("/full_resume/open", True),
+    ("/full_resume/gpa", 3.7),
+    ("/full_resume/experience", [{"title": "a"}, {"title": "b"}]),
+])
+def test_test_passes_on_equal_values(path, value):
+    assert apply_patch(DOC, [{"op": "test", "path": path, "value": value}]) == DOC
+
+
+@pytest.mark.parametrize("path, value", [
+    ("/full_resume/open", 1),
+    ("/full_resume/open", [True]),
+    ("/name", "cv"),
+    ("/full_resume/experience", [{"title": "a"}]),
+    ("/full_resume/experience/0", {"title": "a", "extra": None}),
+])
+def test_test_fails_on_different_values(path, value):
+    with pytest.raises(PatchTestFailed):
+        apply_patch(DOC, [{"op": "test", "path": path, "value": value}])
+
+
+def test_boolean_and_number_are_different_json_types():
+    with pytest.raises(PatchTestFailed):
+        apply_patch({"flag": 1}, [{"op": "test", "path": "/flag", "value": True}])
+    with pytest.raises(PatchTestFailed):
+        apply_patch({"flag": False}, [{"op": "test", "path": "/flag", "value": 0}])
+    assert apply_patch({"n": 1}, [{"op": "test", "path": "/n", "value": 1.0}]) == {"n": 1}
+
+
+def test_failed_test_aborts_the_whole_patch():
+    with pytest.raises(PatchTestFailed):
+        apply_patch(DOC, [
+            {"op": "replace", "path": "/name", "value": "x"},
+            {"op": "test", "path": "/name", "value": "CV"},
+        ])
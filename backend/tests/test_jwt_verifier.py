@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+import jwt_verifier
+from issuer import SECRET, Issuer
+from jwt_verifier import JWTVerifier
+
+USER = {"id": "user-1", "email": "jane@example.com"}
+
+
+@pytest.fixture(scope="module")
+def issuer():
+    issuer = Issuer()
+    yield issuer
+    issuer.server.shutdown()
+
+
+@pytest.fixture
+def remote_calls():
+    return []
+
+
+@pytest.fixture
+def verifier(issuer, remote_calls):
+    async def remote(token):
+        remote_calls.append(token)
+        return dict(USER)
+
+    return JWTVerifier(secret=SECRET, jwks_url=issuer.jwks_url, fallback=remote)
+
+
+def verify(verifier, token):
+    return asyncio.run(verifier.verify(token))
+
+
+def test_cached_jwks_keys_are_used_without_a_thread_hop(verifier, issuer, monkeypatch):
+    assert verify(verifier, issuer.token(alg="ES256")) == USER  # fetches the JWKS
+
+    async def no_threads(*args, **kwargs):
+        raise AssertionError("verification left the event loop")
+
+    monkeypatch.setattr(jwt_verifier.asyncio, "to_thread", no_threads)
+    verifier.ttl = 0  # skip the verified-token cache so the signature is checked again
+    assert verify(verifier, issuer.token(alg="ES256", email="other@example.com")) == {"id": "user-1", "email": "other@example.com"}
+
+
+def test_valid_hs256_token(verifier, issuer, remote_calls):
+    assert verify(verifier, issuer.token()) == USER
+    assert not remote_calls
+
+
+def test_valid_es256_token_from_jwks(verifier, issuer, remote_calls):
+    assert verify(verifier, issuer.token(alg="ES256")) == USER
+    assert not remote_calls
+
+
+@pytest.mark.parametrize("make_token", [
+    lambda issuer: issuer.token(exp=int(time.time()) - 10),
+    lambda issuer: issuer.token(alg="ES256", exp=int(time.time()) - 10),
+    lambda issuer: issuer.token(aud="anon"),
+    lambda issuer: issuer.token(secret="another-secret-with-enough-bytes-for-hs256"),
+    lambda issuer: issuer.token(alg="ES256", sub=None),
+    lambda issuer: "not-a-jwt",
+], ids=["expired", "expired-es256", "wrong-audience", "bad-signature", "missing-sub", "garbage"])
+def test_invalid_tokens_are_rejected_locally(verifier, issuer, remote_calls, make_token):
+    assert verify(verifier, make_token(issuer)) is None
+    assert not remote_calls
+
+
+def test_es256_signed_with_another_key_is_rejected(verifier, issuer, remote_calls):
+    forged = Issuer()
+    try:
+        assert verify(verifier, forged.token(alg="ES256")) is None
+    finally:
+        forged.server.shutdown()
+    assert not remote_calls
+
+
+def test_unknown_kid_refreshes_the_jwks(verifier, issuer, remote_calls):
+    verifier.jwks_cooldown = 0
+    assert verify(verifier, issuer.token(alg="ES256")) == USER
+    fetched = issuer.jwks_requests
+
+    issuer.add_key("rotated-in")
+    assert verify(verifier, issuer.token(alg="ES256", kid="rotated-in")) == USER
+    assert issuer.jwks_requests == fetched + 1
+    assert not remote_calls
+
+
+def test_unknown_kids_refetch_at_most_once_per_cooldown(verifier, issuer, remote_calls):
+    assert verify(verifier, issuer.token(alg="ES256")) == USER
+    fetched = issuer.jwks_requests
+
+    for i in range(3):
+        assert verify(verifier, issuer.token(alg="ES256", kid=f"made-up-{i}")) == USER
+    assert issuer.jwks_requests == fetched
+    assert len(remote_calls) == 3
+
+
+def test_unpublished_kid_falls_back_to_remote_check(verifier, issuer, remote_calls):
+    token = issuer.token(alg="ES256", kid="never-published")
+    assert verify(verifier, token) == USER
+    assert verify(verifier, token) == USER
+    assert remote_calls == [token]
+
+
+def test_remote_rejection_is_not_cached(issuer):
+    calls = []
+
+    async def remote(token):
+        calls.append(token)
+        return None
+
+    verifier = JWTVerifier(jwks_url=issuer.jwks_url, fallback=remote)
+    token = issuer.token()  # HS256 without a configured secret
+    assert verify(verifier, token) is None
+    assert verify(verifier, token) is None
+    assert len(calls) == 2
+
+
+def test_remotely_verified_tokens_are_cached_until_they_expire(verifier, issuer, remote_calls, monkeypatch):
+    now = time.time()
+    token = issuer.token(alg="ES256", kid="never-published", exp=int(now) + 5)
+    assert verify(verifier, token) == USER
+    assert verify(verifier, token) == USER
+    assert len(remote_calls) == 1
+
+    # Still inside the 60s TTL, but past the token's exp: ask again
+    monkeypatch.setattr(jwt_verifier.time, "time", lambda: now + 10)
+    verify(verifier, token)
+    assert len(remote_calls) == 2
@@ -0,0 +1,35 @@
+from keywords import ALIASES, KeywordMatcher, tokenize
+
+
+def _is_subsequence(short, long):
+    return any(long[i:i + len(short)] == short for i in range(len(long) - len(short) + 1))
+
+
+def test_no_alias_is_contained_in_another_of_its_group():
+    for group in ALIASES:
+        patterns = [tokenize(name) for name in group]
+        for i, short in enumerate(patterns):
+            for j, long in enumerate(patterns):
+                assert i == j or not _is_subsequence(short, long), group
+
+
+def test_counts_whole_tokens_only():
+    matcher = KeywordMatcher(("C", "Java", "C++"))
+    assert matcher.counts("C++ and C# and JavaScript") == [0, 0, 1]
+
+
+def test_aliases_are_summed():
+    matcher = KeywordMatcher(("Kubernetes", "PostgreSQL"))
+    assert matcher.counts("We run k8s (Kubernetes) on Postgres and psql.") == [2, 2]
+
+
+def test_multi_word_names_count_once():
+    matcher = KeywordMatcher(("Amazon Web Services", "Azure"))
+    assert matcher.counts("Amazon Web Services (AWS) and Microsoft Azure") == [2, 1]
+
+
+def test_everyday_words_only_match_in_the_same_case():
+    matcher = KeywordMatcher(("REST", "Go"))
+    assert matcher.counts("Rest assured, you will go far and get some rest.") == [0, 0]
+    assert matcher.counts("Design REST APIs in Go or Golang.") == [1, 2]
+    assert KeywordMatcher(("rest",)).counts("REST endpoints, rest of the team") == [1]
@@ -0,0 +1,26 @@
+from latex_template import CompiledTemplate, escape_latex
+
+
+def test_escapes_every_special_character_once():
+    assert escape_latex(r"50% of $5 & #1_a {x} ~ ^ \ ") == (
+        r"50\% of \$5 \& \#1\_a \{x\} \textasciitilde{} \textasciicircum{} \textbackslash{} "
+    )
+
+
+def test_backslash_braces_are_not_escaped_again():
+    assert escape_latex("a\\b") == r"a\textbackslash{}b"
+
+
+def test_nul_is_not_turned_into_a_backslash():
+    assert escape_latex("a\x00b") == "a\x00b"
+    assert escape_latex("a\x00b\\") == "a\x00b\\textbackslash{}"
+
+
+def test_plain_text_is_returned_as_is():
+    assert escape_latex("Plain text") == "Plain text"
+    assert escape_latex(None) == ""
+
+
+def test_compiled_template_fills_slots_and_keeps_unknown_ones():
+    template = CompiledTemplate(r"\name{{{FULL_NAME}}} {{OTHER}}")
+    assert template.render({"FULL_NAME": "Jane"}) == r"\name{Jane} {{OTHER}}"
@@ -0,0 +1,69 @@
+from models import Resume
+from page_fit import PageMetrics, fit_to_page
+
+
+def metrics(page_height: float) -> PageMetrics:
+    # Both skill lines ("Languages: ", "Technologies: ") take one 10pt line: 20pt is always used
+    return PageMetrics(page_height=page_height, header=0, section_title=0, education_entry=5, experience_heading=10,
+                       project_heading=10, chars_per_line=20, line_height=10, bullet_gap=0, slack=0)
+
+
+def resume(experience: list[list[float]], projects: list[list[float]], education: int = 0, text: str = "one line") -> Resume:
+    def section(i, scores):
+        return {"employer": f"E{i}", "title": f"T{i}", "location": "", "duration": "", "languages": [],
+                "bullets": [{"text": text, "score": score} for score in scores]}
+
+    return Resume({
+        "education": [{"est_name": f"School {i}"} for i in range(education)],
+        "experience": [section(i, scores) for i, scores in enumerate(experience)],
+        "projects": [section(i, scores) for i, scores in enumerate(projects)],
+        "technologies": [],
+        "languages": [],
+    })
+
+
+def kept(fitted: Resume) -> tuple[list[list[float]], list[list[float]]]:
+    return ([[b.score for b in s.bullets] for s in fitted.experience],
+            [[b.score for b in s.bullets] for s in fitted.projects])
+
+
+def test_everything_is_kept_when_it_fits():
+    # 20 + (10 + 3*10) + (10 + 2*10) = 90
+    assert kept(fit_to_page(resume([[5, 4, 3]], [[6, 1]]), metrics(90))) == ([[5, 4, 3]], [[6, 1]])
+
+
+def test_picks_the_best_prefixes_within_the_budget():
+    # Budget 50: A1+P2 = 5+7, A2+P1 = 9+6, A3 alone = 12; A2+P1 wins
+    assert kept(fit_to_page(resume([[5, 4, 3]], [[6, 1]]), metrics(70))) == ([[5, 4]], [[6]])
+
+
+def test_projects_are_dropped_before_experiences_lose_every_bullet():
+    # Budget 20 holds one section with one bullet; the project scores higher but the experience is required
+    assert kept(fit_to_page(resume([[1]], [[100]]), metrics(40))) == ([[1]], [])
+
+
+def test_a_low_scoring_project_is_dropped_for_more_experience_bullets():
+    # Budget 40: A3 alone (12) beats A1 + P1 (5 + 1) at the same height
+    assert kept(fit_to_page(resume([[5, 4, 3]], [[1]]), metrics(60))) == ([[5, 4, 3]], [])
+
+
+def test_multi_line_bullets_cost_more():
+    # 30 chars at 20 per line: 20pt each. Budget 40 holds the heading and one bullet, not two
+    fitted = fit_to_page(resume([[5, 4]], [], text="x" * 30), metrics(60))
+    assert kept(fitted) == ([[5]], [])
+
+
+def test_education_counts_against_the_page():
+    # Two education entries use 10pt of the 50pt budget
+    assert kept(fit_to_page(resume([[5, 4, 3]], [], education=2), metrics(70))) == ([[5, 4, 3]], [])
+    assert kept(fit_to_page(resume([[5, 4, 3]], [], education=2), metrics(60))) == ([[5, 4]], [])
+
+
+def test_sections_without_bullets_are_kept():
+    fitted = fit_to_page(resume([[], [5]], [[]]), metrics(60))
+    assert kept(fitted) == ([[], [5]], [[]])
+
+
+def test_falls_back_to_one_bullet_per_experience_when_nothing_fits():
+    # Budget 5 can't hold any heading: experiences keep their best bullet, projects go
+    assert kept(fit_to_page(resume([[5, 4], [3, 2]], [[9]]), metrics(25))) == ([[5], [3]], [])
@@ -0,0 +1,21 @@
+from relevance import chunk_text
+
+
+def test_chunks_respect_max_chars_and_keep_list_numbers_in_text():
+    text = "Requirements:\n- 5+ years of Python.\n1. Build APIs. Ship often!\n" + "word " * 200
+    chunks = chunk_text(text, 80)
+    assert all(len(chunk) <= 80 for chunk in chunks)
+    assert "5+ years of Python." in " ".join(chunks)
+    assert " ".join(chunks).split() == ("Requirements: 5+ years of Python. Build APIs. Ship often! " + "word " * 200).split()
+
+
+def test_chunk_count_is_capped():
+    text = "\n".join(f"Requirement number {i} is quite specific." for i in range(1000))
+    chunks = chunk_text(text, 100, max_chunks=8)
+    assert len(chunks) == 8
+    assert chunks[0].startswith("Requirement number 0 ")
+    assert len(chunk_text(text, 100)) > 8
+
+
+def test_empty_text_is_one_chunk():
+    assert chunk_text("  \n ", 100) == [""]
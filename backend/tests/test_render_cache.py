@@ -0,0 +1,28 @@
+from render_cache import RenderCache, render_key
+
+
+def test_overwriting_a_key_does_not_grow_the_byte_count(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1000)
+    for _ in range(5):
+        cache.put("key", b"x" * 300)
+    cache.put("other", b"y" * 300)
+
+    assert cache.stats()["bytes"] == 600
+    assert cache.get("key") == b"x" * 300
+    assert cache.get("other") == b"y" * 300
+
+
+def test_eviction_keeps_the_total_under_the_limit(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1000)
+    for i in range(6):
+        cache.put(f"key-{i}", b"x" * 300)
+
+    assert cache.stats()["bytes"] <= 1000
+    assert cache.get("key-5") is not None
+
+
+def test_render_key_ignores_metrics():
+    plain = {"experience": [{"bullets": [{"text": "a"}]}]}
+    scored = {"experience": [{"bullets": [{"text": "a", "score": 0.4, "similarity": 0.2}]}]}
+    assert render_key("tpl", plain, "pdf") == render_key("tpl", scored, "pdf")
+    assert render_key("tpl", plain, "pdf") != render_key("tpl", plain, "latex")
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import threading
+import time
+
+from renderer import END_OF_DUMP, FormatCache, PdfRenderer
+
+LATEX = "\\documentclass{article}\n" + END_OF_DUMP + "\n\\begin{document}Hi\\end{document}\n"
+
+
+class BlockingBuilds(FormatCache):
+    """FormatCache whose builds wait for `release` and then write the .fmt (or fail)."""
+
+    def __init__(self, path: str, succeed: bool = True):
+        super().__init__(path)
+        self.release = threading.Event()
+        self.builds: list[str] = []
+        self.succeed = succeed
+
+    def _build(self, name: str, preamble: str) -> bool:
+        self.builds.append(name)
+        self.release.wait(5)
+        if self.succeed:
+            with open(os.path.join(self.path, f"{name}.fmt"), "w") as f:
+                f.write(preamble)
+        return self.succeed
+
+
+def wait_for_builder(formats: FormatCache):
+    deadline = time.monotonic() + 5
+    while formats._builder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert formats._builder is None
+
+
+def test_formats_are_built_in_the_background(tmp_path):
+    formats = BlockingBuilds(str(tmp_path))
+    assert formats.format_for(LATEX) is None
+    assert formats.format_for(LATEX) is None  # still building: not queued twice
+
+    formats.release.set()
+    wait_for_builder(formats)
+    name = formats.format_for(LATEX)
+    assert name is not None and formats.builds == [name]
+
+
+def test_failed_builds_are_not_retried(tmp_path):
+    formats = BlockingBuilds(str(tmp_path), succeed=False)
+    formats.release.set()
+    formats.prepare(LATEX)
+    wait_for_builder(formats)
+
+    assert formats.format_for(LATEX) is None
+    assert len(formats.builds) == 1 and formats._builder is None
+
+
+def test_renders_never_wait_for_a_format_build(tmp_path):
+    formats = BlockingBuilds(str(tmp_path))
+    renderer = PdfRenderer(workers=1, timeout=1.0, formats=formats)
+    used = []
+
+    async def passes(temp_dir, tex_file, fmt):
+        used.append(fmt)
+        return b"%PDF"
+
+    renderer._passes = passes
+    # The build is blocked far past the job timeout; the render compiles without a format
+    assert asyncio.run(renderer.render(LATEX)) == b"%PDF"
+    assert used == [None]
+
+    formats.release.set()
+    wait_for_builder(formats)
+    asyncio.run(renderer.render(LATEX))
+    assert used == [None, formats.builds[0]]
@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/tailor", {"resume": [], "job_description": "Python"}),
+    ("/tailor/stream", {"resume": "resume", "job_description": "Python"}),
+    ("/tailor/batch", {"resumes": [{}, 1], "job_descriptions": ["Python"]}),
+    ("/export/pdf", {"resume": 7}),
+    ("/export/latex", {"resume": None}),
+])
+def test_non_object_resumes_are_rejected(client, path, body):
+    response = client.post(path, json=body)
+    assert response.status_code == 422
+    assert "JSON object" in response.text
+
+
+@pytest.mark.parametrize("body", [
+    {"full_resume": "resume"},
+    {"full_resume": {}, "tailored_resume": [1, 2]},
+])
+def test_saved_resume_bodies_must_be_objects(client, body):
+    assert client.post("/resumes", json=body).status_code == 422
+
+
+def test_updated_resume_bodies_must_be_objects(client):
+    resume_id = client.post("/resumes", json={"full_resume": {"full_name": "Jane"}}).json()["resume"]["id"]
+
+    assert client.put(f"/resumes/{resume_id}", json={"full_resume": 7}).status_code == 422
+    assert client.put(f"/resumes/{resume_id}", json={"tailored_resume": "x"}).status_code == 422
+    assert client.get(f"/resumes/{resume_id}").json()["resume"]["full_resume"] == {"full_name": "Jane"}
@@ -0,0 +1,213 @@
+import asyncio
+
+import httpx
+import pytest
+
+import api
+from resume_store import SupabaseResumeStore
+from test_resumes import RESUME, create
+
+PATCH = {"Content-Type": "application/json-patch+json"}
+
+
+def patch(client, resume_id, operations, **headers):
+    return client.patch(f"/resumes/{resume_id}", json=operations, headers={**PATCH, **headers})
+
+
+# --- ETags ---
+
+def test_get_revalidates_with_if_none_match(client):
+    resume = create(client)
+    response = client.get(f"/resumes/{resume['id']}")
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        unchanged = client.get(f"/resumes/{resume['id']}", headers={"If-None-Match": header})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["ETag"] == etag
+
+    assert client.get(f"/resumes/{resume['id']}", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_writes_change_the_etag(client):
+    resume = create(client)
+    etag = client.get(f"/resumes/{resume['id']}").headers["ETag"]
+
+    updated = client.put(f"/resumes/{resume['id']}", json={"name": "New"})
+    assert updated.headers["ETag"] != etag
+    assert client.get(f"/resumes/{resume['id']}", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(f"/resumes/{resume['id']}", headers={"If-None-Match": updated.headers["ETag"]}).status_code == 304
+
+
+def test_if_match_uses_strong_comparison(client):
+    resume = create(client)
+    etag = client.get(f"/resumes/{resume['id']}").headers["ETag"]
+
+    assert client.put(f"/resumes/{resume['id']}", json={"name": "A"}, headers={"If-Match": f"W/{etag}"}).status_code == 412
+    assert patch(client, resume["id"], [{"op": "replace", "path": "/name", "value": "A"}], **{"If-Match": f"W/{etag}"}).status_code == 412
+
+    response = client.put(f"/resumes/{resume['id']}", json={"name": "A"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    # The old tag is now stale
+    assert client.put(f"/resumes/{resume['id']}", json={"name": "B"}, headers={"If-Match": etag}).status_code == 412
+    assert client.put(f"/resumes/{resume['id']}", json={"name": "B"}, headers={"If-Match": "*"}).status_code == 200
+
+
+def test_if_match_on_missing_resume_is_404(client):
+    assert client.put("/resumes/missing", json={"name": "A"}, headers={"If-Match": "*"}).status_code == 404
+
+
+# --- PATCH ---
+
+def test_patch_writes_only_changed_fields(client, monkeypatch):
+    resume = create(client)
+    etag = client.get(f"/resumes/{resume['id']}").headers["ETag"]
+    store = api._resume_store
+    written = []
+    update = store.update_resume
+
+    async def spy(user_id, resume_id, fields, if_updated_at=None):
+        written.append(set(fields))
+        return await update(user_id, resume_id, fields, if_updated_at=if_updated_at)
+
+    monkeypatch.setattr(store, "update_resume", spy)
+    response = patch(client, resume["id"], [
+        {"op": "test", "path": "/full_resume/full_name", "value": "Jane Doe"},
+        {"op": "replace", "path": "/full_resume/experience/0/bullets/0/text", "value": "Shipped it twice"},
+    ], **{"If-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["resume"]["full_resume"]["experience"][0]["bullets"][0]["text"] == "Shipped it twice"
+    assert response.json()["resume"]["name"] == "Resume"
+    assert written == [{"full_resume"}]
+
+    # A patch that changes nothing doesn't write
+    response = patch(client, resume["id"], [{"op": "replace", "path": "/name", "value": "Resume"}])
+    assert response.status_code == 200
+    assert written == [{"full_resume"}]
+
+
+@pytest.mark.parametrize("operations", [
+    [{"op": "replace", "path": "/name", "value": 123}],
+    [{"op": "replace", "path": "/name", "value": None}],
+    [{"op": "replace", "path": "/full_resume", "value": None}],
+    [{"op": "replace", "path": "/full_resume", "value": ["a"]}],
+    [{"op": "replace", "path": "/tailored_resume", "value": ["a"]}],
+    [{"op": "replace", "path": "/tailored_resume", "value": "text"}],
+], ids=repr)
+def test_patch_keeps_field_types(client, operations):
+    resume = create(client)
+    response = patch(client, resume["id"], operations)
+    assert response.status_code == 422
+    stored = client.get(f"/resumes/{resume['id']}").json()["resume"]
+    assert (stored["name"], stored["full_resume"], stored["tailored_resume"]) == ("Resume", RESUME, None)
+
+
+def test_patch_can_set_and_clear_the_tailored_resume(client):
+    resume = create(client)
+    set_ = patch(client, resume["id"], [{"op": "add", "path": "/tailored_resume", "value": {"full_name": "J"}}])
+    assert set_.json()["resume"]["tailored_resume"] == {"full_name": "J"}
+    cleared = patch(client, resume["id"], [{"op": "replace", "path": "/tailored_resume", "value": None}])
+    assert cleared.json()["resume"]["tailored_resume"] is None
+
+
+@pytest.mark.parametrize("operations, status", [
+    ([{"op": "add", "path": "/user_id", "value": "user-2"}], 400),
+    ([{"op": "remove", "path": "/name"}], 400),
+    ([{"op": "replace", "path": "", "value": {}}], 400),
+    ([{"op": "remove", "path": "/full_resume/missing"}], 400),
+    ([{"op": "test", "path": "/name", "value": "Other"}], 409),
+    ({"op": "replace", "path": "/name", "value": "A"}, 422),
+    (["replace"], 422),
+], ids=repr)
+def test_patch_errors(client, operations, status):
+    resume = create(client)
+    assert patch(client, resume["id"], operations).status_code == status
+
+
+def test_patch_missing_resume_is_404(client):
+    assert patch(client, "missing", []).status_code == 404
+    create(client, user="user-2")
+    other = client.get("/resumes", headers={"X-Test-User": "user-2"}).json()["resumes"][0]
+    assert patch(client, other["id"], [{"op": "replace", "path": "/name", "value": "Mine"}]).status_code == 404
+
+
+# --- Pagination ---
+
+def _page_through(client, limit):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/resumes", params=params).json()
+        assert len(page["resumes"]) <= limit
+        ids += [resume["id"] for resume in page["resumes"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def test_cursor_round_trip():
+    row = {"id": "8c7e0f2a-4b1d-4e8a-9c3f-2d5b6a7e8f90", "updated_at": "2026-01-01T00:00:00.123456+00:00", "name": "x"}
+    assert api._decode_cursor(api._encode_cursor(row)) == (row["updated_at"], row["id"])
+
+
+def _crafted(updated_at, resume_id):
+    return api._encode_cursor({"updated_at": updated_at, "id": resume_id})
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!", "bm90IGpzb24", "WzFd", "WzEsMl0", "eyJhIjoxfQ",
+    _crafted('2026-01-01T00:00:00+00:00",id.gt."0', "8c7e0f2a-4b1d-4e8a-9c3f-2d5b6a7e8f90"),
+    _crafted("2026-01-01T00:00:00+00:00", '0"),or(id.gt."0'),
+])
+def test_invalid_cursors_are_rejected(client, cursor):
+    assert client.get("/resumes", params={"limit": 2, "cursor": cursor}).status_code == 400
+
+
+def test_supabase_list_quotes_cursor_values():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.params)
+        return httpx.Response(200, json=[])
+
+    async def list_page():
+        async with httpx.AsyncClient(base_url="https://example.supabase.co", transport=httpx.MockTransport(handler)) as http:
+            return await SupabaseResumeStore(http, "key").list_resumes("user-1", limit=2, after=('t",x\\', 'a)"b'))
+
+    assert asyncio.run(list_page()) == []
+    assert seen[0]["user_id"] == "eq.user-1"
+    assert seen[0]["or"] == r'(updated_at.lt."t\",x\\",and(updated_at.eq."t\",x\\",id.lt."a)\"b"))'
+
+
+def test_pages_cover_every_resume_once(client):
+    created = [create(client, f"r{i}")["id"] for i in range(7)]
+    everything = client.get("/resumes").json()
+    assert everything["next_cursor"] is None
+    assert [resume["id"] for resume in everything["resumes"]] == created[::-1]
+
+    for limit in (1, 2, 3, 7, 100):
+        assert _page_through(client, limit) == created[::-1]
+
+
+def test_paging_is_stable_across_equal_updated_at(client):
+    created = [create(client, f"r{i}")["id"] for i in range(9)]
+    for row in api._resume_store._rows.values():
+        row["updated_at"] = "2026-01-01T00:00:00+00:00"
+
+    ids = _page_through(client, 2)
+    assert ids == sorted(created, reverse=True)
+
+    # A resume saved mid-way moves to the front without repeating or hiding others
+    first = client.get("/resumes", params={"limit": 4}).json()
+    client.put(f"/resumes/{first['resumes'][0]['id']}", json={"name": "edited"})
+    rest = client.get("/resumes", params={"limit": 100, "cursor": first["next_cursor"]}).json()["resumes"]
+    assert [r["id"] for r in first["resumes"]] + [r["id"] for r in rest] == ids
+
+
+@pytest.mark.parametrize("limit", [0, 101])
+def test_limit_is_bounded(client, limit):
+    assert client.get("/resumes", params={"limit": limit}).status_code == 422
@@ -0,0 +1,72 @@
+RESUME = {"full_name": "Jane Doe", "experience": [{"employer": "Acme", "bullets": [{"text": "Shipped it"}]}]}
+
+
+def create(client, name="Resume", user="user-1", **fields):
+    response = client.post("/resumes", json={"name": name, "full_resume": RESUME, **fields}, headers={"X-Test-User": user})
+    assert response.status_code == 200
+    return response.json()["resume"]
+
+
+def test_create_and_get(client):
+    created = create(client, "Backend", tailored_resume={"full_name": "Jane"})
+    assert created["name"] == "Backend"
+    assert created["user_id"] == "user-1"
+
+    fetched = client.get(f"/resumes/{created['id']}").json()["resume"]
+    assert fetched == created
+    assert fetched["full_resume"] == RESUME
+    assert fetched["tailored_resume"] == {"full_name": "Jane"}
+
+
+def test_list_returns_summaries_newest_first(client):
+    first = create(client, "First")
+    second = create(client, "Second")
+
+    resumes = client.get("/resumes").json()["resumes"]
+    assert [r["id"] for r in resumes] == [second["id"], first["id"]]
+    assert set(resumes[0]) == {"id", "name", "created_at", "updated_at"}
+
+
+def test_update_changes_only_given_fields(client):
+    created = create(client)
+
+    response = client.put(f"/resumes/{created['id']}", json={"name": "Renamed"})
+    assert response.status_code == 200
+    updated = response.json()["resume"]
+    assert updated["name"] == "Renamed"
+    assert updated["full_resume"] == RESUME
+    assert updated["updated_at"] >= created["updated_at"]
+
+    assert client.put(f"/resumes/{created['id']}", json={}).status_code == 400
+
+
+def test_delete(client):
+    created = create(client)
+
+    assert client.delete(f"/resumes/{created['id']}").json() == {"deleted": True}
+    assert client.get(f"/resumes/{created['id']}").status_code == 404
+    assert client.delete(f"/resumes/{created['id']}").status_code == 404
+    assert client.get("/resumes").json()["resumes"] == []
+
+
+def test_users_only_see_their_own_resumes(client):
+    mine = create(client, "Mine", user="user-1")
+    theirs = create(client, "Theirs", user="user-2")
+    other = {"X-Test-User": "user-2"}
+
+    assert [r["name"] for r in client.get("/resumes").json()["resumes"]] == ["Mine"]
+    assert [r["name"] for r in client.get("/resumes", headers=other).json()["resumes"]] == ["Theirs"]
+
+    assert client.get(f"/resumes/{mine['id']}", headers=other).status_code == 404
+    assert client.put(f"/resumes/{mine['id']}", json={"name": "Taken"}, headers=other).status_code == 404
+    assert client.delete(f"/resumes/{mine['id']}", headers=other).status_code == 404
+    assert client.get(f"/resumes/{mine['id']}").json()["resume"]["name"] == "Mine"
+    assert client.get(f"/resumes/{theirs['id']}").status_code == 404
+
+
+def test_requires_authentication_without_override(client):
+    import api
+
+    api.app.dependency_overrides.clear()
+    response = client.get("/resumes")
+    assert response.status_code in (401, 503)
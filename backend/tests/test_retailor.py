@@ -0,0 +1,77 @@
+import copy
+
+JOB = "Backend engineer: Python, PostgreSQL and Docker."
+OTHER_JOB = "Frontend engineer: TypeScript and React."
+
+RESUME = {
+    "full_name": "Jane Doe",
+    "contacts": {"email": "jane@example.com"},
+    "education": [],
+    "experience": [
+        {"employer": "Acme", "title": "Engineer", "location": "Toronto, ON", "duration": "2024 - 2025",
+         "bullets": [{"text": "Built a Python billing service", "impressiveness": 0.8},
+                     {"text": "Moved reports to PostgreSQL", "impressiveness": 0.4},
+                     {"text": "Ran the on-call rotation"}]},
+        {"employer": "Initech", "title": "Intern", "location": "Toronto, ON", "duration": "2023",
+         "bullets": [{"text": "Wrote React dashboards", "impressiveness": 0.6}]},
+    ],
+    "projects": [
+        {"title": "Shipyard", "languages": ["Go"],
+         "bullets": [{"text": "Packaged services with Docker", "impressiveness": 0.7},
+                     {"text": "Added a CLI", "impressiveness": 0.2}]},
+    ],
+    "technologies": [{"text": "Docker"}, {"text": "PostgreSQL"}, {"text": "React"}],
+    "languages": [{"text": "Python"}, {"text": "TypeScript"}],
+}
+
+TEXTS = [bullet["text"] for section in RESUME["experience"] + RESUME["projects"] for bullet in section["bullets"]]
+TEXTS += [keyword["text"] for keyword in RESUME["technologies"] + RESUME["languages"]]
+
+
+def tailor(client, resume=RESUME, job_description=JOB, **fields):
+    response = client.post("/tailor", json={"resume": resume, "job_description": job_description, **fields})
+    assert response.status_code == 200
+    return response.json(), response.headers["X-Tailor-Version"]
+
+
+def test_first_tailoring_encodes_every_text_once(client, stub_model):
+    tailor(client)
+    assert sorted(stub_model.encoded) == sorted(TEXTS)
+    assert set(stub_model.targets) == {JOB}
+
+
+def test_count_only_change_skips_the_model_and_keeps_the_version(client, stub_model):
+    full, version = tailor(client)
+    stub_model.encoded.clear()
+
+    trimmed, same_version = tailor(client, exp_bullet_count=1, tech_count=1, base_version=version)
+    assert stub_model.encoded == []
+    assert same_version == version
+    assert [len(section["bullets"]) for section in trimmed["experience"]] == [1, 1]
+    assert trimmed["experience"][0]["bullets"][0] == full["experience"][0]["bullets"][0]
+    assert trimmed["technologies"] == full["technologies"][:1]
+
+
+def test_one_edited_bullet_encodes_only_that_text(client, stub_model):
+    _, version = tailor(client)
+    stub_model.encoded.clear()
+
+    edited = copy.deepcopy(RESUME)
+    edited["experience"][0]["bullets"][1]["text"] = "Moved reports to PostgreSQL and cut load times"
+    tailored, new_version = tailor(client, edited, base_version=version)
+
+    assert stub_model.encoded == ["Moved reports to PostgreSQL and cut load times"]
+    assert new_version != version
+    assert tailored == tailor(client, edited)[0]
+
+
+def test_a_different_job_description_ignores_the_base_similarities(client, stub_model):
+    _, version = tailor(client)
+    stub_model.encoded.clear()
+    stub_model.targets.clear()
+
+    tailored, new_version = tailor(client, job_description=OTHER_JOB, base_version=version)
+    assert sorted(stub_model.encoded) == sorted(TEXTS)
+    assert set(stub_model.targets) == {OTHER_JOB}
+    assert new_version != version
+    assert tailored == tailor(client, job_description=OTHER_JOB)[0]
@@ -0,0 +1,31 @@
+import numpy as np
+
+from scheduler import EmbeddingScheduler
+
+
+def _fake_encode(calls):
+    def encode(texts, prompt_name):
+        calls.append(len(texts))
+        return np.array([[float(text)] for text in texts])
+    return encode
+
+
+def test_oversized_request_is_encoded_in_slices():
+    calls = []
+    scheduler = EmbeddingScheduler(_fake_encode(calls), max_batch_size=4, max_wait=0)
+    texts = [str(i) for i in range(10)]
+
+    embeddings = scheduler.encode(texts)
+
+    assert calls == [4, 4, 2]
+    np.testing.assert_array_equal(embeddings[:, 0], np.arange(10))
+
+
+def test_duplicate_texts_are_encoded_once():
+    calls = []
+    scheduler = EmbeddingScheduler(_fake_encode(calls), max_batch_size=8, max_wait=0)
+
+    embeddings = scheduler.encode(["1", "2", "1"])
+
+    assert calls == [2]
+    np.testing.assert_array_equal(embeddings[:, 0], [1.0, 2.0, 1.0])
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from models import Resume
+from resumer import IMP_WEIGHT, SIM_WEIGHT, Resumer
+
+
+def reference_scores(resume: Resume, bullet_sims: list[float]):
+    """The per-object scoring _score_entries replaced: calculate_score, avg_* and list sorts."""
+    for bullet, sim in zip(resume.all_bullets(), bullet_sims):
+        bullet.similarity = sim
+        bullet.score = bullet.calculate_score(sim_weight=SIM_WEIGHT, imp_weight=IMP_WEIGHT)
+    for section in resume.experience + resume.projects:
+        section.similarity = section.avg_similarity()
+        section.impressiveness = section.avg_impressiveness()
+        section.score = section.calculate_score(sim_weight=SIM_WEIGHT, imp_weight=IMP_WEIGHT)
+        section.sort_bullets_by_score()
+    resume.sort_experience_by_score()
+    resume.sort_projects_by_score()
+
+
+def section(name: str, impressiveness: list) -> dict:
+    return {"employer": name, "title": name, "location": "", "duration": "", "languages": [],
+            "bullets": [{"text": f"{name}-{i}", "impressiveness": imp} for i, imp in enumerate(impressiveness)]}
+
+
+CASES = {
+    "missing and zero impressiveness": (
+        [section("a", [None, 0, 0.9]), section("b", [0.2, None])],
+        [section("p", [0, 0])],
+        [0.3, 0.0, 0.8, 0.5, 0.5, 0.1, 0.7],
+    ),
+    "tied bullets and sections": (
+        [section("a", [0.5, 0.5, 0.5]), section("b", [0.5, 0.5, 0.5]), section("c", [0.5, 0.5, 0.5])],
+        [section("p", [0.4, 0.4]), section("q", [0.4, 0.4])],
+        [0.5] * 13,
+    ),
+    "empty sections": (
+        [section("a", []), section("b", [0.6]), section("c", [])],
+        [section("p", []), section("q", [None])],
+        [0.4, 0.0],
+    ),
+    "no sections": ([], [], []),
+}
+
+
+def snapshot(resume: Resume) -> list:
+    return [
+        (s.title, pytest.approx(s.similarity), pytest.approx(s.impressiveness), pytest.approx(s.score),
+         [(b.text, pytest.approx(b.similarity), pytest.approx(b.score)) for b in s.bullets])
+        for s in resume.experience + resume.projects
+    ]
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_columnar_scoring_matches_per_object_scoring(case):
+    experience, projects, sims = CASES[case]
+    data = {"experience": experience, "projects": projects, "technologies": [], "languages": []}
+    expected, actual = Resume(data), Resume(data)
+
+    reference_scores(expected, sims)
+    Resumer()._score_sections(actual, np.asarray(sims, dtype=np.float64))
+
+    assert snapshot(actual) == snapshot(expected)
@@ -0,0 +1,53 @@
+import copy
+
+import pytest
+
+import api
+from models import Resume
+from test_retailor import JOB, OTHER_JOB, RESUME, TEXTS
+
+SECOND = copy.deepcopy(RESUME)
+SECOND["full_name"] = "John Roe"
+SECOND["experience"][0]["bullets"][0]["text"] = "Led a Go migration"
+SECOND["technologies"].append({"text": "Kubernetes"})
+
+
+def approx(value):
+    """`value` with every float wrapped in pytest.approx, for comparing nested JSON."""
+    if isinstance(value, dict):
+        return {key: approx(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [approx(item) for item in value]
+    if isinstance(value, float):
+        return pytest.approx(value)
+    return value
+
+
+def batch(client, resumes, job_descriptions, **fields):
+    response = client.post("/tailor/batch", json={"resumes": resumes, "job_descriptions": job_descriptions, **fields})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+def test_results_match_tailoring_each_pair(client, stub_model):
+    resumes, jobs = [RESUME, SECOND], [JOB, OTHER_JOB, ""]
+    results = batch(client, resumes, jobs, exp_bullet_count=2, tech_count=3)
+
+    assert len(results) == 2 and all(len(row) == 3 for row in results)
+    for i, resume in enumerate(resumes):
+        for j, job_description in enumerate(jobs):
+            expected = api.resumer.tailor_resume(Resume(copy.deepcopy(resume)), job_description, exp_bullet_count=2, tech_count=3)
+            assert results[i][j] == approx(expected.to_dict())
+
+
+def test_texts_shared_across_resumes_are_encoded_once(client, stub_model):
+    batch(client, [RESUME, SECOND], [JOB, OTHER_JOB])
+
+    assert len(stub_model.encoded) == len(set(stub_model.encoded))
+    assert set(stub_model.encoded) == set(TEXTS) | {"Led a Go migration", "Kubernetes"}
+    assert stub_model.targets == [JOB, OTHER_JOB]
+
+
+def test_empty_batches(client, stub_model):
+    assert batch(client, [RESUME, SECOND], []) == [[], []]
+    assert batch(client, [], [JOB]) == []
@@ -0,0 +1,61 @@
+import orjson
+
+from test_retailor import JOB, RESUME, tailor
+
+
+def stream(client, resume=RESUME, **fields) -> list[dict]:
+    response = client.post("/tailor/stream", json={"resume": resume, "job_description": JOB, **fields})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [orjson.loads(line) for line in response.text.splitlines()]
+
+
+def test_events_arrive_skills_then_sections_then_resume(client, stub_model):
+    events = stream(client)
+    assert [event["event"] for event in events] == ["skills", "section", "section", "section", "resume"]
+    assert [(event["kind"], event["index"]) for event in events[1:-1]] == [("experience", 0), ("experience", 1), ("projects", 0)]
+
+
+def test_partial_records_match_the_final_resume(client, stub_model):
+    events = stream(client, exp_bullet_count=2, tech_count=2)
+    skills, sections, final = events[0], events[1:-1], events[-1]["resume"]
+
+    assert skills["technologies"] == final["technologies"]
+    assert skills["languages"] == final["languages"]
+    for event in sections:
+        section = event["section"]
+        assert section in final[event["kind"]]
+        assert len(section["bullets"]) <= 2
+
+
+def test_final_record_matches_tailor(client, stub_model):
+    final = stream(client, exp_bullet_count=2)[-1]
+    expected, _ = tailor(client, exp_bullet_count=2)
+    assert final["resume"] == expected
+    assert final["version"]
+
+
+def test_count_only_change_streams_just_the_resume(client, stub_model):
+    version = stream(client)[-1]["version"]
+    stub_model.encoded.clear()
+
+    events = stream(client, exp_bullet_count=1, base_version=version)
+    assert [event["event"] for event in events] == ["resume"]
+    assert events[0]["version"] == version
+    assert stub_model.encoded == []
+
+
+def test_failures_arrive_as_an_error_record(client, stub_model):
+    events = stream(client, resume={})
+    assert events == [{"event": "error", "detail": "Missing resume field: experience"}]
+
+    bad_bullet = {**RESUME, "projects": [{"title": "X", "languages": [], "bullets": "not a list"}]}
+    events = stream(client, resume=bad_bullet)
+    assert events[-1]["event"] == "error"
+    assert "resume" not in [event["event"] for event in events]
+
+
+def test_tailor_reports_the_same_missing_field(client, stub_model):
+    response = client.post("/tailor", json={"resume": {}, "job_description": JOB})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Missing resume field: experience"
@@ -19,6 +19,7 @@ const SUPABASE_ANON_KEY = window.RESUMER_CONFIG?.SUPABASE_ANON_KEY || 'eyJhbGciO
 let supabaseClient = null;
 let currentUser = null;
 let currentResumeId = null; // Track which resume we're editing
+let savedSnapshot = null; // { id, etag, body } of the resume as last saved or loaded, for PATCH diffs and If-None-Match
 
 // Single source of truth
 let resumeData = {
@@ -32,6 +33,7 @@ let resumeData = {
 };
 
 let tailoredResume = null;
+let tailorVersion = null; // lets the API rescore only what changed since the last preview
 let sectionStates = { edu: true, exp: true, proj: true }; // true = expanded
 
 // === Debounce utility ===
@@ -229,6 +231,7 @@ async function logout() {
     await supabaseClient.auth.signOut();
     currentUser = null;
     currentResumeId = null;
+    savedSnapshot = null;
     cachedResumes = [];
     updateAuthUI(false);
     
@@ -265,11 +268,19 @@ async function loadResumes() {
     document.getElementById('resumesList').innerHTML = 'Loading...';
     
     try {
-        const res = await fetch(`${API_BASE}/resumes`, { headers: authHeader });
-        if (!res.ok) throw new Error('Failed to load resumes');
-        const data = await res.json();
-        cachedResumes = data.resumes || [];
-        renderResumesList(cachedResumes);
+        // Fetch page by page so the first names show up quickly for large libraries
+        const resumes = [];
+        let cursor = null;
+        do {
+            const query = `limit=${RESUMES_PAGE_SIZE}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : '');
+            const res = await fetch(`${API_BASE}/resumes?${query}`, { headers: authHeader });
+            if (!res.ok) throw new Error('Failed to load resumes');
+            const data = await res.json();
+            resumes.push(...(data.resumes || []));
+            cursor = data.next_cursor;
+            cachedResumes = resumes;
+            renderResumesList(cachedResumes);
+        } while (cursor);
     } catch (e) {
         console.error('Failed to load resumes:', e);
         document.getElementById('resumesList').innerHTML = 'Failed to load resumes.';
@@ -278,6 +289,35 @@ async function loadResumes() {
 
 // Cache resumes list for duplicate name check
 let cachedResumes = [];
+const RESUMES_PAGE_SIZE = 50;
+
+const pointerToken = key => key.replace(/~/g, '~0').replace(/\//g, '~1');
+
+// JSON Patch turning the last saved copy into `body`: whole name/tailored_resume,
+// but only the top-level sections of full_resume that changed
+function buildResumePatch(saved, body) {
+    const ops = [];
+    const same = (a, b) => JSON.stringify(a) === JSON.stringify(b);
+    if (!same(saved.name, body.name)) ops.push({ op: 'replace', path: '/name', value: body.name });
+    if (!same(saved.tailored_resume, body.tailored_resume)) {
+        ops.push({ op: 'replace', path: '/tailored_resume', value: body.tailored_resume });
+    }
+    const before = saved.full_resume || {};
+    const after = body.full_resume || {};
+    if (!saved.full_resume) {
+        ops.push({ op: 'replace', path: '/full_resume', value: after });
+        return ops;
+    }
+    for (const key of Object.keys(after)) {
+        const path = '/full_resume/' + pointerToken(key);
+        if (!(key in before)) ops.push({ op: 'add', path, value: after[key] });
+        else if (!same(before[key], after[key])) ops.push({ op: 'replace', path, value: after[key] });
+    }
+    for (const key of Object.keys(before)) {
+        if (!(key in after)) ops.push({ op: 'remove', path: '/full_resume/' + pointerToken(key) });
+    }
+    return ops;
+}
 
 function getUniqueName(baseName) {
     const existingNames = cachedResumes.map(r => r.name);
@@ -337,14 +377,35 @@ async function saveToCloud() {
         };
         
         let res;
-        if (currentResumeId) {
-            // Update existing
+        if (currentResumeId && savedSnapshot?.id === currentResumeId) {
+            // Send only what changed since the last save/load
+            const ops = buildResumePatch(savedSnapshot.body, body);
+            if (!ops.length) {
+                alert('Resume saved!');
+                return;
+            }
+            res = await fetch(`${API_BASE}/resumes/${currentResumeId}`, {
+                method: 'PATCH',
+                headers: {
+                    ...authHeader,
+                    'Content-Type': 'application/json-patch+json',
+                    ...(savedSnapshot.etag ? { 'If-Match': savedSnapshot.etag } : {})
+                },
+                body: JSON.stringify(ops)
+            });
+            if (res.status === 412) {
+                if (!confirm('This resume was changed elsewhere since you loaded it. Overwrite it?')) return;
+                res = null;
+            }
+        }
+        if (!res && currentResumeId) {
+            // Update existing (full body)
             res = await fetch(`${API_BASE}/resumes/${currentResumeId}`, {
                 method: 'PUT',
                 headers: { ...authHeader, 'Content-Type': 'application/json' },
                 body: JSON.stringify(body)
             });
-        } else {
+        } else if (!res) {
             // Create new
             res = await fetch(`${API_BASE}/resumes`, {
                 method: 'POST',
@@ -356,6 +417,7 @@ async function saveToCloud() {
         if (!res.ok) throw new Error('Failed to save');
         const data = await res.json();
         if (data.resume?.id) currentResumeId = data.resume.id;
+        savedSnapshot = { id: currentResumeId, etag: res.headers.get('ETag'), body: JSON.parse(JSON.stringify(body)) };
         alert('Resume saved!');
         loadResumes();
     } catch (e) {
@@ -378,10 +440,24 @@ async function loadCloudResume(id) {
     container.innerHTML = 'Loading resume...';
     
     try {
-        const res = await fetch(`${API_BASE}/resumes/${id}`, { headers: authHeader });
-        if (!res.ok) throw new Error('Failed to load');
-        const data = await res.json();
-        const resume = data.resume;
+        // Revalidate our copy instead of downloading it again when it's unchanged
+        const cached = savedSnapshot?.id === id && savedSnapshot.etag ? savedSnapshot : null;
+        const res = await fetch(`${API_BASE}/resumes/${id}`, {
+            headers: cached ? { ...authHeader, 'If-None-Match': cached.etag } : authHeader
+        });
+        let resume;
+        if (res.status === 304) {
+            resume = { id, ...JSON.parse(JSON.stringify(cached.body)) };
+        } else {
+            if (!res.ok) throw new Error('Failed to load');
+            const data = await res.json();
+            resume = data.resume;
+            savedSnapshot = {
+                id: resume.id,
+                etag: res.headers.get('ETag'),
+                body: { name: resume.name, full_resume: resume.full_resume, tailored_resume: resume.tailored_resume }
+            };
+        }
         
         currentResumeId = resume.id;
         
@@ -424,6 +500,7 @@ async function deleteCloudResume(id) {
         });
         if (!res.ok) throw new Error('Failed to delete');
         if (currentResumeId === id) currentResumeId = null;
+        if (savedSnapshot?.id === id) savedSnapshot = null;
         loadResumes();
     } catch (e) {
         alert('Failed to delete: ' + e.message);
@@ -696,22 +773,66 @@ async function generatePreview() {
     const preview = document.getElementById('preview');
     preview.innerHTML = '<span class="loading">Loading...</span>';
 
+    // Nothing to export until the final resume arrives
+    tailoredResume = null;
+    setExportEnabled(false);
     try {
-        const res = await fetch(`${API_BASE}/tailor`, {
+        const apiData = prepareApiData();
+        const res = await fetch(`${API_BASE}/tailor/stream`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ resume: prepareApiData(), job_description: document.getElementById('jobDescription').value })
+            body: JSON.stringify({
+                resume: apiData,
+                job_description: document.getElementById('jobDescription').value,
+                base_version: tailorVersion,
+                fit: document.getElementById('fitPage').checked,
+                template: document.getElementById('template').value
+            })
         });
         if (!res.ok) throw new Error((await res.json()).detail || 'Failed');
-        tailoredResume = await res.json();
+
+        // NDJSON: skills first, then each section as it is scored, then the final resume
+        const partial = { ...apiData, experience: [...apiData.experience], projects: [...apiData.projects] };
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        let buffered = '';
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            for (const line of lines.filter(Boolean)) {
+                const msg = JSON.parse(line);
+                if (msg.event === 'error') throw new Error(msg.detail);
+                if (msg.event === 'skills') {
+                    partial.technologies = msg.technologies;
+                    partial.languages = msg.languages;
+                    renderPreview(partial);
+                } else if (msg.event === 'section') {
+                    partial[msg.kind][msg.index] = msg.section;
+                    renderPreview(partial);
+                } else if (msg.event === 'resume') {
+                    tailorVersion = msg.version;
+                    tailoredResume = msg.resume;
+                }
+            }
+        }
+        if (!tailoredResume) throw new Error('Tailoring ended unexpectedly');
         renderPreview(tailoredResume);
-        document.getElementById('btnPdf').disabled = false;
-        document.getElementById('btnLatex').disabled = false;
+        setExportEnabled(true);
     } catch (e) {
+        tailoredResume = null;
+        setExportEnabled(false);
         preview.innerHTML = `<span class="error">Error: ${e.message}</span>`;
     }
 }
 
+function setExportEnabled(enabled) {
+    document.getElementById('btnPdf').disabled = !enabled;
+    document.getElementById('btnLatex').disabled = !enabled;
+}
+
 function renderPreview(r) {
     let html = `<div class="preview-header"><h2>${r.full_name || 'Name'}</h2>
         <div>${[r.contacts?.phone, r.contacts?.email, r.contacts?.github, r.contacts?.linkedin].filter(Boolean).join(' | ')}</div></div>`;
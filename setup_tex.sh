@@ -14,4 +14,4 @@ command -v tlmgr &>/dev/null || {
 
 tlmgr install \
     mathptmx geometry enumitem titlesec nopageno hyperref rsfs \
-    latexsym fullpage marvosym xcolor fancyhdr babel tabularx
+    latexsym fullpage marvosym xcolor fancyhdr babel tabularx mylatexformat